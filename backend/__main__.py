@@ -1,16 +1,55 @@
 import os
-
-import bjoern
+import socket
+from collections.abc import Callable
+from functools import partial
 
 from .config import Config
-from .wsgi import create_app
+from .prefork import supervise
+
+
+def bind_socket() -> socket.socket:
+    if Config.UNIX_SOCKET:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.bind(Config.UNIX_SOCKET)
+    else:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind(("0.0.0.0", 9999))
+    sock.listen(1024)
+    sock.setblocking(False)
+    return sock
+
+
+def prepare_asyncio() -> Callable[[], None]:
+    from restcraft.core import serve
+
+    from .asgi import create_asgi_app
+
+    return partial(serve, create_asgi_app(), sock=bind_socket())
+
+
+def prepare_bjoern() -> Callable[[], None]:
+    import bjoern
+
+    from .wsgi import create_app
 
-if __name__ == "__main__":
     if Config.UNIX_SOCKET:
-        if os.path.exists(Config.UNIX_SOCKET):
-            os.remove(Config.UNIX_SOCKET)
-        print(f"[Server] Listening on unix:{Config.UNIX_SOCKET}.")
-        bjoern.run(create_app(), f"unix:{Config.UNIX_SOCKET}")
+        bjoern.listen(create_app(), f"unix:{Config.UNIX_SOCKET}")
+    else:
+        bjoern.listen(create_app(), "0.0.0.0", 9999)
+    return bjoern.run
+
+
+if __name__ == "__main__":
+    if Config.UNIX_SOCKET and os.path.exists(Config.UNIX_SOCKET):
+        os.remove(Config.UNIX_SOCKET)
+    if Config.SERVER == "asyncio":
+        run = prepare_asyncio()
+    else:
+        run = prepare_bjoern()
+    address = f"unix:{Config.UNIX_SOCKET}" if Config.UNIX_SOCKET else "port 9999"
+    print(f"[Server] Listening on {address} ({Config.SERVER}).")
+    if Config.PROCESSES > 1:
+        supervise(run, Config.PROCESSES, Config.RESTART_DELAY)
     else:
-        print("[Server] Listening on port 9999.")
-        bjoern.run(create_app(), "0.0.0.0", 9999)
+        run()
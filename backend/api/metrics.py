@@ -0,0 +1,10 @@
+from restcraft.http import Request
+from restcraft.metrics import registry
+from restcraft.views import View
+
+
+class MetricsView(View):
+    stateless = True
+
+    def get(self, req: Request):
+        return 200, {"content-type": "text/plain; version=0.0.4"}, registry.render()
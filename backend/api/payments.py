@@ -1,16 +1,36 @@
-from restcraft.http import Request, jsonify
+from restcraft.core.exceptions import RestCraft, ValidationError
+from restcraft.http import Request, frozen_json, jsonify
 from restcraft.views import View
 
+from ..config import Config
 from ..services import payment
 from .serializers import CreatePaymentsSerializer, FilterPaymentsSerializer
 
+OK = frozen_json(status_code=200)
+ACCEPTED = frozen_json(status_code=202)
+
+
+def validated_raw_payment(req: Request) -> bytes:
+    if not req.content_length:
+        raise ValidationError({"body": ["This field is required."]})
+    if req.content_length > Config.MAX_PAYMENT_BODY:
+        raise RestCraft({"body": ["Invalid payload size."]}, status=413)
+    body = req.raw_body
+    if not (body.startswith(b"{") and body.rstrip().endswith(b"}")):
+        raise ValidationError({"body": ["Payload must be a JSON object."]})
+    for field in (b'"correlationId"', b'"amount"'):
+        if field not in body:
+            raise ValidationError({field[1:-1].decode(): ["This field is required."]})
+    return body
+
 
 class PaymentsSummaryView(View):
 
     query_params_serializer = FilterPaymentsSerializer
+    stateless = True
 
-    def get(self, _: Request):
-        data, *_ = self.validated_query_params(True)
+    def get(self, req: Request):
+        data, *_ = self.validated_query_params(True, req)
         payments = payment.get_payments(data["from_"], data["to"])
         return jsonify(payments, status_code=200)
 
@@ -18,15 +38,47 @@ class PaymentsSummaryView(View):
 class PaymentsView(View):
 
     body_serializer = CreatePaymentsSerializer
+    stateless = True
 
-    def post(self, _: Request):
-        data, *_ = self.validated_body(True)
+    def post(self, req: Request):
+        if Config.FAST_ENQUEUE:
+            payment.enqueue_raw_payment(validated_raw_payment(req))
+            return ACCEPTED
+        data, *_ = self.validated_body(True, req)
         payment.enqueue_payment(data)
-        return jsonify(status_code=202)
+        return ACCEPTED
 
 
 class PaymentsPurgeView(View):
 
+    stateless = True
+
     def post(self, _: Request):
         payment.purge_payments()
-        return jsonify(status_code=200)
+        return OK
+
+
+class AsyncPaymentsSummaryView(PaymentsSummaryView):
+
+    async def get(self, req: Request):
+        data, *_ = self.validated_query_params(True, req)
+        payments = await payment.aget_payments(data["from_"], data["to"])
+        return jsonify(payments, status_code=200)
+
+
+class AsyncPaymentsView(PaymentsView):
+
+    async def post(self, req: Request):
+        if Config.FAST_ENQUEUE:
+            await payment.aenqueue_raw_payment(validated_raw_payment(req))
+            return ACCEPTED
+        data, *_ = self.validated_body(True, req)
+        await payment.aenqueue_payment(data)
+        return ACCEPTED
+
+
+class AsyncPaymentsPurgeView(PaymentsPurgeView):
+
+    async def post(self, _: Request):
+        await payment.apurge_payments()
+        return OK
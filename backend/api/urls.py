@@ -1,9 +1,25 @@
 from restcraft.urls import path
 
-from .payments import PaymentsPurgeView, PaymentsSummaryView, PaymentsView
+from .metrics import MetricsView
+from .payments import (
+    AsyncPaymentsPurgeView,
+    AsyncPaymentsSummaryView,
+    AsyncPaymentsView,
+    PaymentsPurgeView,
+    PaymentsSummaryView,
+    PaymentsView,
+)
 
 urls = [
     path("/payments", PaymentsView),
     path("/payments-summary", PaymentsSummaryView),
     path("/purge-payments", PaymentsPurgeView),
+    path("/metrics", MetricsView),
+]
+
+async_urls = [
+    path("/payments", AsyncPaymentsView),
+    path("/payments-summary", AsyncPaymentsSummaryView),
+    path("/purge-payments", AsyncPaymentsPurgeView),
+    path("/metrics", MetricsView),
 ]
@@ -0,0 +1,13 @@
+from restcraft.core import AsyncApplication
+
+from .api import urls
+from .keydb import akeydb
+from .services import payment
+
+
+def create_asgi_app():
+    payment.load_scripts()
+    payment.migrate_payments()
+    app = AsyncApplication(urls.async_urls, on_shutdown=[akeydb.aclose])
+
+    return app
@@ -9,6 +9,20 @@ def env(key: str, default: Any = None, parse: Callable[[str], T] = str) -> T:
     return parse(os.getenv(key, default))
 
 
+def boolean(value: str) -> bool:
+    return value.lower() in ("1", "true", "yes", "on")
+
+
 class Config:
     KEYDB_URL = env("KEYDB_URL", "redis://localhost")
-    UNIX_SOCKET = env("UNIX_SOCKET")
+    UNIX_SOCKET = env("UNIX_SOCKET", "")
+    SERVER = env("SERVER", "bjoern")
+    PROCESSES = env("PROCESSES", "1", int)
+    RESTART_DELAY = env("RESTART_DELAY", "0.5", float)
+    SUMMARY_AGGREGATION = env("SUMMARY_AGGREGATION", "lua")
+    SUMMARY_CACHE_SIZE = env("SUMMARY_CACHE_SIZE", "32", int)
+    SUMMARY_CACHE_TTL = env("SUMMARY_CACHE_TTL", "0", float)
+    FAST_ENQUEUE = env("FAST_ENQUEUE", "false", boolean)
+    MAX_PAYMENT_BODY = env("MAX_PAYMENT_BODY", "512", int)
+    ENQUEUE_BATCH_SIZE = env("ENQUEUE_BATCH_SIZE", "1", int)
+    ENQUEUE_FLUSH_INTERVAL = env("ENQUEUE_FLUSH_INTERVAL", "0.001", float)
@@ -1,4 +1,5 @@
 from redis import ConnectionPool, StrictRedis
+from redis import asyncio as aioredis
 
 from .config import Config
 
@@ -13,6 +14,14 @@ if Config.KEYDB_URL.startswith("unix:"):
         ),
         protocol=3,
     )
+    akeydb = aioredis.StrictRedis(
+        connection_pool=aioredis.ConnectionPool(
+            connection_class=aioredis.UnixDomainSocketConnection,
+            path=Config.KEYDB_URL.replace("unix:", ""),
+            max_connections=50,
+        ),
+        protocol=3,
+    )
 else:
     keydb = StrictRedis(
         connection_pool=ConnectionPool.from_url(
@@ -21,3 +30,10 @@ else:
         ),
         protocol=3,
     )
+    akeydb = aioredis.StrictRedis(
+        connection_pool=aioredis.ConnectionPool.from_url(
+            Config.KEYDB_URL,
+            max_connections=50,
+        ),
+        protocol=3,
+    )
@@ -0,0 +1,55 @@
+import os
+import signal
+import time
+import traceback
+from collections.abc import Callable
+
+
+def spawn(run: Callable[[], None]) -> int:
+    pid = os.fork()
+    if pid:
+        return pid
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    code = 0
+    try:
+        run()
+    except Exception:
+        traceback.print_exc()
+        code = 1
+    finally:
+        os._exit(code)
+
+
+def supervise(run: Callable[[], None], processes: int, restart_delay: float):
+    children: set[int] = set()
+    stopping = False
+
+    def stop(signum, _):
+        nonlocal stopping
+        stopping = True
+        for pid in list(children):
+            try:
+                os.kill(pid, signum)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+    for _ in range(processes):
+        if stopping:
+            break
+        children.add(spawn(run))
+    print(f"[Server] Supervising {processes} workers: {sorted(children)}.")
+    while children:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+        children.discard(pid)
+        if stopping:
+            continue
+        print(f"[Server] Worker {pid} exited with status {status}, restarting.")
+        time.sleep(restart_delay)
+        if not stopping:
+            children.add(spawn(run))
@@ -1,35 +1,362 @@
-import msgpack
+import asyncio
+import math
+import os
+import signal
+import threading
+import time
+import traceback
+from collections import OrderedDict
 
-from ..keydb import keydb
+from common.codec import PROCESSORS, decode_member, pack_payment
+from common.store import (
+    BUCKET_SECONDS,
+    BUCKETS_KEY,
+    DEAD_KEY,
+    GENERATION_KEY,
+    PAYMENTS_KEY,
+    QUEUE_KEY,
+    RETRY_KEY,
+    SHARD_SECONDS,
+    SHARDS_KEY,
+    WORKERS_KEY,
+    bucket_key,
+    range_keys,
+)
+from restcraft.metrics import registry
+
+from ..config import Config
+from ..keydb import akeydb, keydb
 from ..utils import iso_to_unix
 
+summarize = keydb.register_script(
+    """
+    local totals = {0, 0, 0, 0}
+    local function add(proc, count, cents)
+        local i = proc == 'default' and 1 or 3
+        totals[i] = totals[i] + count
+        totals[i + 1] = totals[i + 1] + cents
+    end
+    if ARGV[1] ~= '' then
+        local buckets = redis.call('ZRANGEBYSCORE', KEYS[1], ARGV[1], ARGV[2])
+        for _, bucket in ipairs(buckets) do
+            local key = 'summary:' .. bucket
+            for _, proc in ipairs({'default', 'fallback'}) do
+                local count, cents = unpack(
+                    redis.call('HMGET', key, proc .. ':count', proc .. ':cents')
+                )
+                add(proc, tonumber(count) or 0, tonumber(cents) or 0)
+            end
+        end
+    end
+    for k = 3, #ARGV, 3 do
+        local members = redis.call('ZRANGEBYSCORE', ARGV[k], ARGV[k + 1], ARGV[k + 2])
+        for _, member in ipairs(members) do
+            local tag = string.byte(member, 1)
+            if tag == 100 or tag == 102 then
+                local proc, amount = string.match(member, '^(%a+):([^:]+):')
+                add(proc, 1, math.floor(tonumber(amount) * 100 + 0.5))
+            else
+                local _, cents = struct.unpack('>Bi8', member)
+                add(tag % 128 == 0 and 'default' or 'fallback', 1, cents)
+            end
+        end
+    end
+    return totals
+    """
+)
+
+
+purge = keydb.register_script(
+    """
+    local function unlink(prefix, ids)
+        for i = 1, #ids, 1000 do
+            local keys = {}
+            for j = i, math.min(i + 999, #ids) do
+                keys[#keys + 1] = prefix .. ids[j]
+            end
+            redis.call('UNLINK', unpack(keys))
+        end
+    end
+    unlink('payments:', redis.call('ZRANGE', KEYS[1], 0, -1))
+    unlink('summary:', redis.call('ZRANGE', KEYS[2], 0, -1))
+    unlink('queue:payments:processing:', redis.call('HKEYS', KEYS[3]))
+    redis.call('UNLINK', unpack(KEYS))
+    redis.call('INCR', ARGV[1])
+    """
+)
+
+migrate = keydb.register_script(
+    """
+    local rows = redis.call('ZRANGE', KEYS[1], 0, -1, 'WITHSCORES')
+    if #rows == 0 then
+        return 0
+    end
+    local bucket_seconds, shard_seconds = tonumber(ARGV[1]), tonumber(ARGV[2])
+    local touched = {}
+    for i = 1, #rows, 2 do
+        local score = tonumber(rows[i + 1])
+        local shard = math.floor(score / shard_seconds)
+        redis.call('ZADD', 'payments:' .. shard, score, rows[i])
+        redis.call('ZADD', KEYS[2], shard, shard)
+        touched[math.floor(score / bucket_seconds)] = true
+    end
+    for bucket in pairs(touched) do
+        local lo = bucket * bucket_seconds
+        local shard = math.floor(lo / shard_seconds)
+        local members = redis.call(
+            'ZRANGEBYSCORE', 'payments:' .. shard, lo, '(' .. (lo + bucket_seconds)
+        )
+        local totals = {default = {0, 0}, fallback = {0, 0}}
+        for _, member in ipairs(members) do
+            local proc, cents
+            local tag = string.byte(member, 1)
+            if tag == 100 or tag == 102 then
+                local amount
+                proc, amount = string.match(member, '^(%a+):([^:]+):')
+                cents = math.floor(tonumber(amount) * 100 + 0.5)
+            else
+                local _
+                _, cents = struct.unpack('>Bi8', member)
+                proc = tag % 128 == 0 and 'default' or 'fallback'
+            end
+            totals[proc][1] = totals[proc][1] + 1
+            totals[proc][2] = totals[proc][2] + cents
+        end
+        redis.call(
+            'HSET', 'summary:' .. bucket,
+            'default:count', totals.default[1], 'default:cents', totals.default[2],
+            'fallback:count', totals.fallback[1], 'fallback:cents', totals.fallback[2]
+        )
+        redis.call('ZADD', KEYS[3], bucket, bucket)
+    end
+    redis.call('UNLINK', KEYS[1])
+    redis.call('INCR', KEYS[4])
+    return #rows / 2
+    """
+)
+
+
+class SummaryCache:
+    def __init__(self, size: int, ttl: float):
+        self.size = size
+        self.ttl = ttl
+        self.entries: OrderedDict[tuple, tuple[bytes, float, dict]] = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key: tuple) -> tuple[bytes, dict | None]:
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry and time.monotonic() - entry[1] < self.ttl:
+                self.entries.move_to_end(key)
+                return entry[0], entry[2]
+        generation = keydb.get(GENERATION_KEY)
+        if entry and entry[0] == generation:
+            self.put(key, generation, entry[2])
+            return generation, entry[2]
+        return generation, None
+
+    def put(self, key: tuple, generation: bytes, data: dict):
+        with self.lock:
+            self.entries[key] = (generation, time.monotonic(), data)
+            self.entries.move_to_end(key)
+            if len(self.entries) > self.size:
+                self.entries.popitem(last=False)
+
+
+summary_cache = SummaryCache(Config.SUMMARY_CACHE_SIZE, Config.SUMMARY_CACHE_TTL)
+
+
+def load_scripts():
+    keydb.script_load(summarize.script)
+    keydb.script_load(purge.script)
+
+
+def migrate_payments():
+    moved = migrate(
+        keys=[PAYMENTS_KEY, SHARDS_KEY, BUCKETS_KEY, GENERATION_KEY],
+        args=[BUCKET_SECONDS, SHARD_SECONDS],
+    )
+    if moved:
+        print(f"[Payment] Migrated {moved} legacy payments into shards.")
+
+
+def _add_members(totals: dict, members: list[bytes]):
+    for member in members:
+        proc, cents = decode_member(member)
+        totals[proc]["count"] += 1
+        totals[proc]["cents"] += cents
+
+
+def _add_buckets(totals: dict, buckets: list[dict]):
+    for bucket in buckets:
+        for proc in PROCESSORS:
+            totals[proc]["count"] += int(bucket.get(f"{proc}:count".encode(), 0))
+            totals[proc]["cents"] += int(bucket.get(f"{proc}:cents".encode(), 0))
+
+
+def _edges(lo: float, hi: float, first: int, last: int) -> list[tuple]:
+    if first >= last:
+        bounds = [(lo, hi, hi)]
+    else:
+        bounds = [
+            (lo, f"({first * BUCKET_SECONDS}", first * BUCKET_SECONDS),
+            (last * BUCKET_SECONDS, hi, hi),
+        ]
+    return [
+        (key, low, high)
+        for low, high, until in bounds
+        for key in range_keys(low, until)
+    ]
+
+
+def _summarize_python(lo: float, hi: float, first: int, last: int) -> dict:
+    totals = {proc: {"count": 0, "cents": 0} for proc in PROCESSORS}
+    pipe = keydb.pipeline(transaction=False)
+    if first < last:
+        pipe.zrangebyscore(BUCKETS_KEY, first, f"({last}")
+    for key, low, high in _edges(lo, hi, first, last):
+        pipe.zrangebyscore(key, low, high)
+    results = pipe.execute()
+    if first < last and (buckets := results.pop(0)):
+        pipe = keydb.pipeline(transaction=False)
+        for bucket in buckets:
+            pipe.hgetall(bucket_key(int(bucket)))
+        _add_buckets(totals, pipe.execute())
+    for members in results:
+        _add_members(totals, members)
+    return totals
+
+
+def _summarize_lua(lo: float, hi: float, first: int, last: int) -> dict:
+    args = [first, f"({last}"] if first < last else ["", ""]
+    for edge in _edges(lo, hi, first, last):
+        args.extend(edge)
+    dcount, dcents, fcount, fcents = summarize(keys=[BUCKETS_KEY], args=args)
+    return {
+        "default": {"count": dcount, "cents": dcents},
+        "fallback": {"count": fcount, "cents": fcents},
+    }
+
 
 def get_payments(from_: str, to: str):
-    members = keydb.zrangebyscore("payments", iso_to_unix(from_), iso_to_unix(to))
+    lo, hi = iso_to_unix(from_), iso_to_unix(to)
+    generation, data = summary_cache.get((lo, hi))
+    if data is not None:
+        return data
+    first, last = math.ceil(lo / BUCKET_SECONDS), math.floor(hi / BUCKET_SECONDS)
+    if Config.SUMMARY_AGGREGATION == "lua":
+        totals = _summarize_lua(lo, hi, first, last)
+    else:
+        totals = _summarize_python(lo, hi, first, last)
     data = {
-        "default": {"totalRequests": 0, "totalAmount": 0},
-        "fallback": {"totalRequests": 0, "totalAmount": 0},
+        proc: {
+            "totalRequests": totals[proc]["count"],
+            "totalAmount": totals[proc]["cents"] / 100,
+        }
+        for proc in PROCESSORS
     }
-    for m in members:
-        proc, amount, _ = m.decode().split(":", 2)
-        data[proc]["totalRequests"] += 1
-        data[proc]["totalAmount"] += float(amount)
-    for k in data:
-        data[k]["totalAmount"] = round(data[k]["totalAmount"], 2)
+    summary_cache.put((lo, hi), generation, data)
     return data
 
 
+class EnqueueBuffer:
+    def __init__(self, size: int, interval: float):
+        self.size = size
+        self.interval = interval
+        self.items: list[bytes] = []
+        self.first_at = 0.0
+        self.lock = threading.Lock()
+        self.pid = None
+
+    def push(self, payment_data: bytes):
+        if self.size <= 1:
+            keydb.rpush(QUEUE_KEY, payment_data)
+            return
+        if self.pid != os.getpid():
+            self.start()
+        with self.lock:
+            if not self.items:
+                self.first_at = time.monotonic()
+            self.items.append(payment_data)
+            if (
+                len(self.items) < self.size
+                and time.monotonic() - self.first_at < self.interval
+            ):
+                return
+            items, self.items = self.items, []
+        keydb.rpush(QUEUE_KEY, *items)
+
+    def flush(self):
+        with self.lock:
+            items, self.items = self.items, []
+        if items:
+            keydb.rpush(QUEUE_KEY, *items)
+
+    def run(self):
+        while True:
+            signum = signal.sigtimedwait((signal.SIGTERM,), self.interval)
+            try:
+                self.flush()
+            except Exception:
+                traceback.print_exc()
+            if signum is not None:
+                os._exit(0)
+
+    def start(self):
+        self.pid = os.getpid()
+        self.lock = threading.Lock()
+        signal.pthread_sigmask(signal.SIG_BLOCK, {signal.SIGTERM})
+        threading.Thread(target=self.run, daemon=True).start()
+
+
+enqueue_buffer = EnqueueBuffer(Config.ENQUEUE_BATCH_SIZE, Config.ENQUEUE_FLUSH_INTERVAL)
+enqueue_duration = registry.histogram(
+    "payment_enqueue_duration_seconds", "Time spent enqueueing payments."
+)
+
+
 def enqueue_payment(payment: dict):
-    keydb.rpush(
-        "queue:payments",
-        msgpack.packb(payment, use_bin_type=True),
-    )
+    started = time.perf_counter()
+    enqueue_buffer.push(pack_payment(payment))
+    enqueue_duration.observe(time.perf_counter() - started)
+
+
+def enqueue_raw_payment(payment_data: bytes):
+    started = time.perf_counter()
+    enqueue_buffer.push(payment_data)
+    enqueue_duration.observe(time.perf_counter() - started)
+
+
+async def aenqueue_payment(payment: dict):
+    started = time.perf_counter()
+    await akeydb.rpush(QUEUE_KEY, pack_payment(payment))
+    enqueue_duration.observe(time.perf_counter() - started)
+
+
+async def aenqueue_raw_payment(payment_data: bytes):
+    started = time.perf_counter()
+    await akeydb.rpush(QUEUE_KEY, payment_data)
+    enqueue_duration.observe(time.perf_counter() - started)
+
+
+async def aget_payments(from_: str, to: str):
+    return await asyncio.to_thread(get_payments, from_, to)
+
+
+async def apurge_payments():
+    await asyncio.to_thread(purge_payments)
 
 
 def purge_payments():
-    keys = keydb.zrange("payments", 0, -1)
-    pipe = keydb.pipeline()
-    if keys:
-        pipe.delete(*keys)
-    pipe.delete("payments")
-    pipe.execute()
+    purge(
+        keys=[
+            SHARDS_KEY,
+            BUCKETS_KEY,
+            WORKERS_KEY,
+            PAYMENTS_KEY,
+            QUEUE_KEY,
+            RETRY_KEY,
+            DEAD_KEY,
+        ],
+        args=[GENERATION_KEY],
+    )
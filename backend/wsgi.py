@@ -1,9 +1,12 @@
 from restcraft.core import Application
 
 from .api import urls
+from .services import payment
 
 
 def create_app():
+    payment.load_scripts()
+    payment.migrate_payments()
     app = Application(urls.urls)
 
     return app
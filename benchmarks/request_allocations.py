@@ -0,0 +1,89 @@
+import io
+import sys
+import timeit
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from restcraft.core import Application  # noqa: E402
+from restcraft.http import Request, frozen_json, jsonify  # noqa: E402
+from restcraft.urls import path  # noqa: E402
+from restcraft.views import View  # noqa: E402
+
+BODY = b'{"correlationId": "4a7901b8-7d26-4d9d-aa19-4dc1c7cf60b3", "amount": 19.9}'
+ACCEPTED = frozen_json(status_code=202)
+
+
+class StatefulView(View):
+    def post(self, req: Request):
+        _ = req.body
+        return jsonify(status_code=202)
+
+
+class StatelessView(View):
+    stateless = True
+
+    def post(self, req: Request):
+        _ = req.body
+        return jsonify(status_code=202)
+
+
+class FrozenView(View):
+    stateless = True
+
+    def post(self, req: Request):
+        _ = req.body
+        return ACCEPTED
+
+
+app = Application(
+    [
+        path("/stateful", StatefulView),
+        path("/stateless", StatelessView),
+        path("/frozen", FrozenView),
+    ]
+)
+
+
+def start_response(status, headers):
+    pass
+
+
+def request(route: str):
+    environ = {
+        "REQUEST_METHOD": "POST",
+        "PATH_INFO": route,
+        "CONTENT_TYPE": "application/json",
+        "CONTENT_LENGTH": str(len(BODY)),
+        "wsgi.input": io.BytesIO(BODY),
+    }
+    app(environ, start_response)
+
+
+def peak_bytes(route: str, rounds: int = 1000) -> float:
+    request(route)
+    tracemalloc.start()
+    total = 0
+    for _ in range(rounds):
+        tracemalloc.reset_peak()
+        base, _ = tracemalloc.get_traced_memory()
+        request(route)
+        _, peak = tracemalloc.get_traced_memory()
+        total += peak - base
+    tracemalloc.stop()
+    return total / rounds
+
+
+def main():
+    rounds = 100_000
+    for route in ("/stateful", "/stateless", "/frozen"):
+        seconds = timeit.timeit(lambda r=route: request(r), number=rounds)
+        print(
+            f"{route:<12} {seconds / rounds * 1e9:8.0f} ns/request "
+            f"{peak_bytes(route):8.0f} peak bytes/request"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+import heapq
+import sys
+from collections import deque
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from worker.routing import FEES, POLICIES, ProcessorState  # noqa: E402
+
+AMOUNT = 19.9
+DURATION = 60.0
+WORKERS = 50
+RETRY_DELAY = 0.05
+STAGES = ((10.0, 100), (40.0, 600), (10.0, 100))
+
+SCENARIOS = {
+    "steady": {
+        "default": ((0.0, False, 0.01),),
+        "fallback": ((0.0, False, 0.01),),
+    },
+    "default-slow": {
+        "default": ((0.0, False, 0.01), (20.0, False, 0.5), (40.0, False, 0.01)),
+        "fallback": ((0.0, False, 0.01),),
+    },
+    "default-down": {
+        "default": ((0.0, False, 0.01), (20.0, True, 0.01), (30.0, False, 0.01)),
+        "fallback": ((0.0, False, 0.05),),
+    },
+}
+
+
+def arrivals():
+    start = 0.0
+    for length, rate in STAGES:
+        for i in range(int(length * rate)):
+            yield start + i / rate
+        start += length
+
+
+def phase(timeline: tuple, now: float) -> tuple[bool, float]:
+    failing, latency = timeline[0][1:]
+    for at, stage_failing, stage_latency in timeline:
+        if at <= now:
+            failing, latency = stage_failing, stage_latency
+    return failing, latency
+
+
+def simulate(policy, scenario: dict) -> dict:
+    events = [(at, 0, "arrive", at) for at in arrivals()]
+    heapq.heapify(events)
+    queue, idle, seq = deque(), WORKERS, 1
+    paid = dict.fromkeys(scenario, 0)
+    lags = []
+    while events:
+        now, _, kind, arrived = heapq.heappop(events)
+        if now > DURATION:
+            break
+        if kind == "done":
+            idle += 1
+        elif kind == "arrive":
+            queue.append(arrived)
+        while idle and queue:
+            arrived = queue.popleft()
+            states = [
+                ProcessorState(name, not failing, FEES[name], latency, WORKERS)
+                for name, (failing, latency) in (
+                    (name, phase(timeline, now)) for name, timeline in scenario.items()
+                )
+            ]
+            route = policy.route(len(queue), states)
+            seq += 1
+            if not route:
+                heapq.heappush(events, (now + RETRY_DELAY, seq, "arrive", arrived))
+                continue
+            failing, latency = phase(scenario[route[0]], now)
+            idle -= 1
+            heapq.heappush(events, (now + latency, seq, "done", arrived))
+            if failing:
+                seq += 1
+                heapq.heappush(events, (now + latency, seq, "arrive", arrived))
+                continue
+            paid[route[0]] += 1
+            lags.append(now + latency - arrived)
+    lags.sort()
+    return {
+        "paid": paid,
+        "profit": sum(
+            AMOUNT * (1 - FEES[name]) * count for name, count in paid.items()
+        ),
+        "p99": lags[int(len(lags) * 0.99)] if lags else 0.0,
+        "pending": sum(1 for _ in arrivals()) - sum(paid.values()),
+    }
+
+
+if __name__ == "__main__":
+    for scenario_name, scenario in SCENARIOS.items():
+        print(f"{scenario_name}:")
+        for policy_name, policy in POLICIES.items():
+            result = simulate(policy(), scenario)
+            print(
+                f"  {policy_name:>8}: profit={result['profit']:>10.2f}"
+                f" p99={result['p99'] * 1000:>8.1f}ms"
+                f" pending={result['pending']:>5} paid={result['paid']}"
+            )
@@ -0,0 +1,51 @@
+import math
+import struct
+import uuid
+
+import msgpack
+import orjson
+
+from .store import to_cents
+
+PROCESSORS = ("default", "fallback")
+PROCESSOR_TAGS = {processor: tag for tag, processor in enumerate(PROCESSORS)}
+
+RAW_ID = 0x80
+HEADER = struct.Struct(">Bq")
+
+
+def encode_member(processor: str, cents: int, correlation_id: str) -> bytes:
+    tag = PROCESSOR_TAGS[processor]
+    try:
+        ident = uuid.UUID(correlation_id).bytes
+    except ValueError:
+        tag |= RAW_ID
+        ident = correlation_id.encode()
+    return HEADER.pack(tag, cents) + ident
+
+
+def decode_member(member: bytes) -> tuple[str, int]:
+    if member[:1] in (b"d", b"f"):
+        processor, amount, _ = member.decode().split(":", 2)
+        return processor, to_cents(float(amount))
+    tag, cents = HEADER.unpack_from(member)
+    return PROCESSORS[tag & ~RAW_ID], cents
+
+
+def pack_payment(payment: dict) -> bytes:
+    return msgpack.packb(payment, use_bin_type=True)
+
+
+def unpack_payment(payment_data: bytes) -> dict:
+    if payment_data[:1] == b"{":
+        data = orjson.loads(payment_data)
+        if not isinstance(correlation_id := data.get("correlationId"), str):
+            raise ValueError("correlationId must be a string.")
+        try:
+            amount = float(data["amount"])
+        except (KeyError, TypeError, ValueError) as e:
+            raise ValueError("amount must be a number.") from e
+        if not math.isfinite(amount):
+            raise ValueError("amount must be finite.")
+        return {"correlation_id": correlation_id, "amount": amount}
+    return msgpack.unpackb(payment_data, raw=False)
@@ -0,0 +1,37 @@
+QUEUE_KEY = "queue:payments"
+RETRY_KEY = "queue:payments:retry"
+PROCESSING_KEY = "queue:payments:processing"
+WORKERS_KEY = "queue:payments:workers"
+DEAD_KEY = "queue:payments:dead"
+
+PAYMENTS_KEY = "payments"
+SHARDS_KEY = "payments:shards"
+BUCKETS_KEY = "summary:buckets"
+GENERATION_KEY = "summary:generation"
+
+SHARD_SECONDS = 10
+BUCKET_SECONDS = 1
+
+
+def shard_of(timestamp: float) -> int:
+    return int(timestamp // SHARD_SECONDS)
+
+
+def shard_key(shard: int) -> str:
+    return f"payments:{shard}"
+
+
+def range_keys(lo: float, hi: float) -> list[str]:
+    return [shard_key(shard) for shard in range(shard_of(lo), shard_of(hi) + 1)]
+
+
+def bucket_of(timestamp: float) -> int:
+    return int(timestamp // BUCKET_SECONDS)
+
+
+def bucket_key(bucket: int) -> str:
+    return f"summary:{bucket}"
+
+
+def to_cents(amount: float) -> int:
+    return round(amount * 100)
@@ -1,5 +1,9 @@
+from .asgi import AsyncApplication
+from .server import serve
 from .wsgi import Application
 
 __all__ = [
     "Application",
+    "AsyncApplication",
+    "serve",
 ]
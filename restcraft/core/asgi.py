@@ -0,0 +1,132 @@
+import inspect
+import io
+import traceback
+from collections import abc
+from time import perf_counter
+
+from ..http import FrozenResponse, Request, on_exception
+from ..urls import path
+from .wsgi import Application
+
+
+async def _read_environ(scope: dict, receive: abc.Callable) -> dict:
+    body = b""
+    more_body = True
+    while more_body:
+        message = await receive()
+        body += message.get("body", b"")
+        more_body = message.get("more_body", False)
+    environ = {
+        "REQUEST_METHOD": scope["method"],
+        "PATH_INFO": scope["path"],
+        "QUERY_STRING": scope.get("query_string", b"").decode("latin-1"),
+        "wsgi.input": io.BytesIO(body),
+    }
+    for name, value in scope.get("headers", ()):
+        key = name.decode("latin-1").upper().replace("-", "_")
+        if key not in ("CONTENT_TYPE", "CONTENT_LENGTH"):
+            key = f"HTTP_{key}"
+        environ[key] = value.decode("latin-1")
+    return environ
+
+
+class AsyncApplication(Application):
+    def __init__(
+        self,
+        urls: list[path],
+        on_exception: abc.Callable[
+            [Request, Exception], tuple[int, dict[str, str], bytes]
+        ] = on_exception,
+        on_startup: list[abc.Callable] = None,
+        on_shutdown: list[abc.Callable] = None,
+    ):
+        super().__init__(urls, on_exception)
+        self.on_startup = on_startup or []
+        self.on_shutdown = on_shutdown or []
+
+    async def startup(self):
+        for hook in self.on_startup:
+            if inspect.isawaitable(result := hook()):
+                await result
+
+    async def shutdown(self):
+        for hook in self.on_shutdown:
+            if inspect.isawaitable(result := hook()):
+                await result
+
+    async def lifespan(self, receive: abc.Callable, send: abc.Callable):
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await self.startup()
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await self.shutdown()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def __call__(self, scope: dict, receive: abc.Callable, send: abc.Callable):
+        if scope["type"] == "lifespan":
+            await self.lifespan(receive, send)
+            return
+        started = perf_counter()
+        try:
+            matched = self.router.match(scope["method"], scope["path"])
+            if not matched:
+                await send(
+                    {
+                        "type": "http.response.start",
+                        "status": 404,
+                        "headers": [(b"content-length", b"0")],
+                    }
+                )
+                await send({"type": "http.response.body", "body": b""})
+                return
+            view, handler_name, params = matched
+            req = Request(await _read_environ(scope, receive), params)
+            view_instance = self.views.get(view)
+            try:
+                if view_instance is None:
+                    view_instance = view()
+                    view_instance.ctx = {"request": req}
+                handler = getattr(view_instance, handler_name)
+                response = handler(req)
+                if inspect.isawaitable(response):
+                    response = await response
+            except Exception as ex:
+                traceback.print_exc()
+                if view_instance and hasattr(view_instance, "on_exception"):
+                    handler = view_instance.on_exception
+                else:
+                    handler = self.on_exception
+                response = handler(req, ex)
+                if inspect.isawaitable(response):
+                    response = await response
+            if response.__class__ is FrozenResponse:
+                status_c, raw_headers, body = (
+                    response.status_code,
+                    response.raw_headers,
+                    response.chunks[0],
+                )
+            else:
+                status_c, headers, body = response
+                if headers.__class__ is not list:
+                    if "content-length" not in headers:
+                        headers["content-length"] = str(len(body))
+                    headers = headers.items()
+                raw_headers = [(k.encode(), v.encode()) for k, v in headers]
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": status_c,
+                    "headers": raw_headers,
+                }
+            )
+            await send(
+                {
+                    "type": "http.response.body",
+                    "body": b"" if req.method == "HEAD" else body,
+                }
+            )
+        finally:
+            self.request_duration.observe(perf_counter() - started)
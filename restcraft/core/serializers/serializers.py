@@ -1,7 +1,81 @@
 from typing import Any
 
 from ..exceptions import ValidationError
-from .fields import Field
+from .fields import BooleanField, Field, FloatField, IntegerField, StringField
+
+_CASTS = {
+    IntegerField: ("int", "Value must be an integer."),
+    FloatField: ("float", "Value must be a float."),
+}
+
+
+def _compile_field(idx: int, name: str, field: Field, ns: dict) -> list[str]:
+    src, key = repr(field.name), repr(name)
+    ns[f"F{idx}"] = field
+    ns[f"D{idx}"] = field.default
+    lines = []
+    if field.required:
+        lines.append(f"raw = data.get({src})")
+    else:
+        lines.append(f"if {src} in data:")
+        lines.append(f"    raw = data[{src}]")
+    ind = "" if field.required else "    "
+    if field.default is not None:
+        lines.append(f"{ind}if raw is None:")
+        lines.append(f"{ind}    raw = D{idx}")
+
+    kind = type(field)
+    if field.validators or kind not in (*_CASTS, StringField, BooleanField):
+        lines.append(f"{ind}try:")
+        lines.append(f"{ind}    validated[{key}] = F{idx}.validate(raw)")
+        lines.append(f"{ind}except ValidationError as e:")
+        lines.append(f"{ind}    errors.update(e.details)")
+        return lines
+
+    lines.append(f"{ind}if raw is None:")
+    if field.required:
+        lines.append(f"{ind}    errors[{src}] = ['This field is required.']")
+    else:
+        lines.append(f"{ind}    validated[{key}] = None")
+    if kind in _CASTS:
+        cast, message = _CASTS[kind]
+        lines.append(f"{ind}else:")
+        lines.append(f"{ind}    try:")
+        lines.append(f"{ind}        validated[{key}] = {cast}(raw)")
+        lines.append(f"{ind}    except (ValueError, TypeError):")
+        lines.append(f"{ind}        errors[{src}] = [{message!r}]")
+    elif kind is StringField:
+        lines.append(f"{ind}elif not isinstance(raw, str):")
+        lines.append(f"{ind}    errors[{src}] = ['Value must be a string.']")
+        if field.max_length:
+            message = f"Cannot be longer than {field.max_length} characters."
+            lines.append(f"{ind}elif len(raw) > {field.max_length}:")
+            lines.append(f"{ind}    errors[{src}] = [{message!r}]")
+        lines.append(f"{ind}else:")
+        lines.append(f"{ind}    validated[{key}] = raw")
+    else:
+        ns[f"T{idx}"] = field._TRUE_VALUES
+        ns[f"N{idx}"] = field._FALSE_VALUES
+        lines.append(f"{ind}elif isinstance(raw, bool):")
+        lines.append(f"{ind}    validated[{key}] = raw")
+        lines.append(f"{ind}elif isinstance(raw, str) and raw.lower() in T{idx}:")
+        lines.append(f"{ind}    validated[{key}] = True")
+        lines.append(f"{ind}elif isinstance(raw, str) and raw.lower() in N{idx}:")
+        lines.append(f"{ind}    validated[{key}] = False")
+        lines.append(f"{ind}else:")
+        lines.append(f"{ind}    errors[{src}] = ['Value must be boolean.']")
+    return lines
+
+
+def _compile_validator(cls_name: str, fields: dict[str, Field]):
+    ns = {"ValidationError": ValidationError}
+    body = ["validated = {}", "errors = {}"]
+    for idx, (name, field) in enumerate(fields.items()):
+        body.extend(_compile_field(idx, name, field, ns))
+    body.append("return validated, errors")
+    source = "def validate(data):\n" + "\n".join(f"    {line}" for line in body)
+    exec(compile(source, f"<serializer {cls_name}>", "exec"), ns)
+    return ns["validate"]
 
 
 class SerializerMeta(type):
@@ -9,12 +83,19 @@ class SerializerMeta(type):
         fields = {}
         for key, value in attrs.items():
             if isinstance(value, Field):
+                value.bind(key)
                 fields[key] = value
+        attrs.setdefault("__slots__", ())
         attrs["__fields__"] = fields
+        attrs["fields"] = fields
+        attrs["_field_cache"] = {key: field.name for key, field in fields.items()}
+        attrs["_validate"] = staticmethod(_compile_validator(name, fields))
         return super().__new__(cls, name, bases, attrs)
 
 
 class Serializer(metaclass=SerializerMeta):
+    __slots__ = ("initial_data", "instance", "context", "_validated_data", "_errors")
+
     def __init__(self, data: dict = None, instance: Any = None, context: dict = None):
         self.initial_data = data
         self.instance = instance
@@ -22,32 +103,11 @@ class Serializer(metaclass=SerializerMeta):
         self._validated_data = None
         self._errors = {}
 
-        self.fields: dict[str, Field] = {}
-        self._field_cache: dict[str, str] = {}
-
-        for name, field in self.__fields__.items():
-            field.bind(name)
-            self.fields[name] = field
-            self._field_cache[name] = field.name
-
     def is_valid(self) -> bool:
         if self.initial_data is None:
             self._errors = {"non_field_errors": ["No data provided."]}
             return False
-        validated_data = {}
-        errors = {}
-        for field_name, field in self.fields.items():
-            source_name = field.name
-            if source_name not in self.initial_data and not field.required:
-                continue
-            raw_value = self.initial_data.get(source_name, None)
-            if raw_value is None and field.default is not None:
-                raw_value = field.default
-            try:
-                validated_value = field.validate(raw_value)
-                validated_data[field_name] = validated_value
-            except ValidationError as e:
-                errors.update(e.details)
+        validated_data, errors = self._validate(self.initial_data)
         if errors:
             self._errors = errors
             return False
@@ -0,0 +1,135 @@
+import asyncio
+import socket
+from collections import abc
+from functools import partial
+
+from ..constants import STATUS_CODE
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+BAD_REQUEST = (
+    f"HTTP/1.1 {STATUS_CODE[400]}\r\n"
+    "content-length: 0\r\nconnection: close\r\n\r\n".encode()
+)
+
+
+def _parse_head(head: bytes) -> tuple[bytes, bytes, bytes, list, int, bool]:
+    request_line, *lines = head[:-4].split(b"\r\n")
+    method, target, version = request_line.split(b" ", 2)
+    if not version.startswith(b"HTTP/"):
+        raise ValueError("Invalid HTTP version.")
+    keep_alive = version == b"HTTP/1.1"
+    content_length = 0
+    headers = []
+    for line in lines:
+        name, _, value = line.partition(b":")
+        name, value = name.strip().lower(), value.strip()
+        headers.append((name, value))
+        if name == b"content-length":
+            content_length = int(value)
+            if content_length < 0:
+                raise ValueError("Invalid content-length.")
+        elif name == b"connection":
+            keep_alive = value.lower() == b"keep-alive"
+    return method, target, version, headers, content_length, keep_alive
+
+
+async def _handle(
+    app: abc.Callable, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+):
+    try:
+        while True:
+            try:
+                head = await reader.readuntil(b"\r\n\r\n")
+            except (asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+                break
+            try:
+                method, target, version, headers, content_length, keep_alive = (
+                    _parse_head(head)
+                )
+                path, _, query = target.partition(b"?")
+                scope = {
+                    "type": "http",
+                    "asgi": {"version": "3.0"},
+                    "http_version": version[5:].decode(),
+                    "method": method.decode(),
+                    "path": path.decode(),
+                    "raw_path": path,
+                    "query_string": query,
+                    "headers": headers,
+                }
+            except ValueError:
+                writer.write(BAD_REQUEST)
+                await writer.drain()
+                break
+            body = await reader.readexactly(content_length) if content_length else b""
+
+            async def receive(body=body):
+                return {"type": "http.request", "body": body, "more_body": False}
+
+            response = []
+
+            async def send(message: dict, response=response):
+                response.append(message)
+
+            await app(scope, receive, send)
+            start, *chunks = response
+            payload = b"".join(chunk.get("body", b"") for chunk in chunks)
+            out = [f"HTTP/1.1 {STATUS_CODE[start['status']]}\r\n".encode()]
+            has_length = False
+            for name, value in start["headers"]:
+                has_length = has_length or name.lower() == b"content-length"
+                out.append(name + b": " + value + b"\r\n")
+            if not has_length:
+                out.append(b"content-length: %d\r\n" % len(payload))
+            if not keep_alive:
+                out.append(b"connection: close\r\n")
+            out.append(b"\r\n")
+            out.append(payload)
+            writer.writelines(out)
+            await writer.drain()
+            if not keep_alive:
+                break
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    finally:
+        writer.close()
+
+
+async def _serve(
+    app: abc.Callable,
+    unix: str = None,
+    host: str = "0.0.0.0",
+    port: int = 9999,
+    sock: socket.socket = None,
+):
+    if startup := getattr(app, "startup", None):
+        await startup()
+    handler = partial(_handle, app)
+    if sock is not None:
+        server = await asyncio.start_server(handler, sock=sock)
+    elif unix:
+        server = await asyncio.start_unix_server(handler, path=unix)
+    else:
+        server = await asyncio.start_server(handler, host, port)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        if shutdown := getattr(app, "shutdown", None):
+            await shutdown()
+
+
+def serve(
+    app: abc.Callable,
+    unix: str = None,
+    host: str = "0.0.0.0",
+    port: int = 9999,
+    sock: socket.socket = None,
+):
+    if uvloop is not None:
+        uvloop.install()
+    asyncio.run(_serve(app, unix, host, port, sock))
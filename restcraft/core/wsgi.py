@@ -1,10 +1,12 @@
 import traceback
-from collections import abc, defaultdict
+from collections import abc
 from inspect import getmembers, isfunction
+from time import perf_counter
 
 from ..constants import METHODS, STATUS_CODE
-from ..http import Request, on_exception
-from ..urls import exec_it, match_it, parse_it, path
+from ..http import FrozenResponse, Request, on_exception
+from ..metrics import registry
+from ..urls import Router, path
 
 
 class Application:
@@ -15,8 +17,12 @@ class Application:
             [Request, Exception], tuple[int, dict[str, str], bytes]
         ] = on_exception,
     ):
-        self.routes = defaultdict(list)
+        self.router = Router()
+        self.views = {}
         self.on_exception = on_exception
+        self.request_duration = registry.histogram(
+            "restcraft_request_duration_seconds", "Time spent handling requests."
+        )
         self.process_urls(urls)
 
     def process_urls(self, urls: list[path]):
@@ -24,47 +30,55 @@ class Application:
             if isinstance(p.view, list):
                 self.process_urls(p.view)
                 continue
+            if getattr(p.view, "stateless", False) and p.view not in self.views:
+                self.views[p.view] = p.view()
             for name, _ in getmembers(p.view, isfunction):
                 method_name = name.upper()
                 if method_name not in METHODS:
                     continue
-                rules = parse_it(p.path)
-                rules[0].update({"view": p.view, "handler": name})
-                self.routes[method_name].append(rules)
+                self.router.add(method_name, p.path, p.view, name)
                 if (
                     method_name == "GET"
                     and not hasattr(p.view, "head")
                     and not hasattr(p.view, "HEAD")
                 ):
-                    self.routes["HEAD"].append(rules)
+                    self.router.add("HEAD", p.path, p.view, name)
 
     def __call__(self, environ: dict, start_response):
-        http_method = environ.get("REQUEST_METHOD", "get").upper()
-        request_path = environ.get("PATH_INFO", "/")
-        matched_routes = match_it(request_path, self.routes.get(http_method, []))
-        if not matched_routes:
-            start_response(STATUS_CODE[404], (("Content-Length", "0"),))
-            return []
-        req = Request(environ)
-        params = exec_it(req.path, matched_routes)
-        req.path_params = params
-        route, *_ = matched_routes
-        view_instance = None
+        started = perf_counter()
         try:
-            view_instance = route["view"]()
-            view_instance.ctx = {"request": req}
-            handler = getattr(view_instance, route["handler"])
-            status_c, headers, body = handler(req)
-        except Exception as ex:
-            traceback.print_exc()
-            if view_instance and hasattr(view_instance, "on_exception"):
-                handler = view_instance.on_exception
-            else:
-                handler = self.on_exception
-            status_c, headers, body = handler(req, ex)
-        if "content-length" not in headers:
-            headers["content-length"] = str(len(body))
-        start_response(STATUS_CODE[status_c], list(headers.items()))
-        if req.method == "HEAD":
-            return []
-        return [body]
+            http_method = environ.get("REQUEST_METHOD", "get").upper()
+            matched = self.router.match(http_method, environ.get("PATH_INFO", "/"))
+            if not matched:
+                start_response(STATUS_CODE[404], (("Content-Length", "0"),))
+                return []
+            view, handler_name, params = matched
+            req = Request(environ, params)
+            view_instance = self.views.get(view)
+            try:
+                if view_instance is None:
+                    view_instance = view()
+                    view_instance.ctx = {"request": req}
+                handler = getattr(view_instance, handler_name)
+                response = handler(req)
+            except Exception as ex:
+                traceback.print_exc()
+                if view_instance and hasattr(view_instance, "on_exception"):
+                    handler = view_instance.on_exception
+                else:
+                    handler = self.on_exception
+                response = handler(req, ex)
+            if response.__class__ is FrozenResponse:
+                start_response(response.status, response.headers)
+                return () if req.method == "HEAD" else response.chunks
+            status_c, headers, body = response
+            if headers.__class__ is not list:
+                if "content-length" not in headers:
+                    headers["content-length"] = str(len(body))
+                headers = list(headers.items())
+            start_response(STATUS_CODE[status_c], headers)
+            if req.method == "HEAD":
+                return []
+            return [body]
+        finally:
+            self.request_duration.observe(perf_counter() - started)
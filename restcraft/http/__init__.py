@@ -1,8 +1,10 @@
 from .request import Request
-from .response import jsonify, on_exception
+from .response import FrozenResponse, frozen_json, jsonify, on_exception
 
 __all__ = [
     "Request",
+    "FrozenResponse",
+    "frozen_json",
     "jsonify",
     "on_exception",
 ]
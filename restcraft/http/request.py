@@ -8,9 +8,36 @@ except ImportError:
     import json
 
 
+def _content_length(value: str | None) -> int:
+    try:
+        return max(int(value or 0), 0)
+    except ValueError:
+        return 0
+
+
 class Request:
-    def __init__(self, environ: dict[str, str]):
+    __slots__ = (
+        "ENV",
+        "method",
+        "path",
+        "content_length",
+        "path_params",
+        "_body",
+        "_raw",
+        "_qs",
+        "_headers",
+    )
+
+    def __init__(self, environ: dict[str, str], path_params: dict[str, str] = None):
         self.ENV = environ
+        self.method = environ.get("REQUEST_METHOD", "GET")
+        self.path = environ.get("PATH_INFO", "/")
+        self.content_length = _content_length(environ.get("CONTENT_LENGTH"))
+        self.path_params = {} if path_params is None else path_params
+        self._body = None
+        self._raw = None
+        self._qs = None
+        self._headers = None
 
     @property
     def body(self) -> dict[str, Any]:
@@ -18,63 +45,46 @@ class Request:
             raise Exception("Method must be POST, PUT or PATCH.")
         if self.content_length and not self.content_type:
             raise Exception("Missing headers, content type must be present.")
-        if hasattr(self, "__body__"):
-            return self.__body__
+        if self._body is not None:
+            return self._body
         content_type = self.content_type
-        content_length = self.content_length
-        stream = self.ENV.get("wsgi.input", io.BytesIO())
         if content_type == "application/x-www-form-urlencoded":
-            parsed = parse_qs(
-                stream.read(content_length).decode(), keep_blank_values=True
-            )
-            self.__body__ = {k: v[0] if len(v) == 1 else v for k, v in parsed.items()}
+            parsed = parse_qs(self.raw_body.decode(), keep_blank_values=True)
+            self._body = {k: v[0] if len(v) == 1 else v for k, v in parsed.items()}
         elif content_type == "application/json":
-            self.__body__ = json.loads(stream.read(content_length).decode())
+            self._body = json.loads(self.raw_body)
         else:
             raise Exception("Content type not supported.")
-        return self.__body__
-
-    @property
-    def path_params(self) -> dict[str, str]:
-        return getattr(self, "__params__", {})
-
-    @path_params.setter
-    def path_params(self, params: dict[str, str]):
-        self.__params__ = params
-
-    @property
-    def method(self):
-        return self.ENV.get("REQUEST_METHOD", "GET")
+        return self._body
 
     @property
-    def path(self):
-        return self.ENV.get("PATH_INFO", "/")
+    def raw_body(self) -> bytes:
+        if self._raw is None:
+            stream = self.ENV.get("wsgi.input", io.BytesIO())
+            self._raw = stream.read(self.content_length)
+        return self._raw
 
     @property
     def query_params(self):
-        if hasattr(self, "__qs__"):
-            return self.__qs__
+        if self._qs is not None:
+            return self._qs
         if not (qs_raw := self.ENV.get("QUERY_STRING")):
             return {}
         parsed = parse_qs(qs_raw, keep_blank_values=True)
-        self.__qs__ = {k: v[0] if len(v) == 1 else v for k, v in parsed.items()}
-        return self.__qs__
+        self._qs = {k: v[0] if len(v) == 1 else v for k, v in parsed.items()}
+        return self._qs
 
     @property
     def headers(self):
-        if hasattr(self, "__headers__"):
-            return self.__headers__
-        self.__headers__ = {
+        if self._headers is not None:
+            return self._headers
+        self._headers = {
             key[5:].replace("_", "-").lower(): value
             for key, value in self.ENV.items()
             if key.startswith("HTTP_")
         }
-        return self.__headers__
+        return self._headers
 
     @property
     def content_type(self):
         return self.ENV.get("CONTENT_TYPE")
-
-    @property
-    def content_length(self):
-        return int(self.ENV.get("CONTENT_LENGTH", 0) or 0)
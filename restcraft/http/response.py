@@ -1,3 +1,4 @@
+from ..constants import STATUS_CODE
 from .request import Request
 
 try:
@@ -17,6 +18,27 @@ def jsonify(body="", status_code=200, headers=None):
     return status_code, nheaders, nbody
 
 
+class FrozenResponse:
+    __slots__ = ("status_code", "status", "headers", "raw_headers", "chunks")
+
+    def __init__(self, status_code: int, headers: dict[str, str], body: bytes):
+        headers = {**headers, "content-length": str(len(body))}
+        self.status_code = status_code
+        self.status = STATUS_CODE[status_code]
+        self.headers = list(headers.items())
+        self.raw_headers = [(k.encode(), v.encode()) for k, v in self.headers]
+        self.chunks = (body,)
+
+    def __setattr__(self, name, value):
+        if hasattr(self, name):
+            raise AttributeError(f"{type(self).__name__} is immutable.")
+        super().__setattr__(name, value)
+
+
+def frozen_json(body="", status_code=200, headers=None) -> FrozenResponse:
+    return FrozenResponse(*jsonify(body, status_code, headers))
+
+
 def on_exception(_: Request, ex: Exception):
     status_code = getattr(ex, "status", 500)
     details, *_ = ex.args
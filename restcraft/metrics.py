@@ -0,0 +1,123 @@
+from array import array
+from bisect import bisect_left
+
+DEFAULT_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+)
+
+
+def _labels(labels: dict[str, str], extra: str = "") -> str:
+    pairs = [f'{key}="{value}"' for key, value in labels.items()]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class Counter:
+    __slots__ = ("name", "labels", "values")
+    kind = "counter"
+
+    def __init__(self, name: str, labels: dict[str, str]):
+        self.name = name
+        self.labels = labels
+        self.values = array("d", (0.0,))
+
+    def inc(self, amount: float = 1.0):
+        self.values[0] += amount
+
+    def render(self) -> list[str]:
+        return [f"{self.name}{_labels(self.labels)} {self.values[0]}"]
+
+
+class Gauge(Counter):
+    __slots__ = ()
+    kind = "gauge"
+
+    def set(self, value: float):
+        self.values[0] = value
+
+
+class Histogram:
+    __slots__ = ("name", "labels", "bounds", "counts", "values")
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        labels: dict[str, str],
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        self.name = name
+        self.labels = labels
+        self.bounds = buckets
+        self.counts = array("Q", bytes(8 * (len(buckets) + 1)))
+        self.values = array("d", (0.0,))
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.values[0] += value
+
+    def render(self) -> list[str]:
+        lines, total = [], 0
+        for bound, count in zip((*self.bounds, "+Inf"), self.counts, strict=True):
+            total += count
+            le = _labels(self.labels, f'le="{bound}"')
+            lines.append(f"{self.name}_bucket{le} {total}")
+        labels = _labels(self.labels)
+        lines.append(f"{self.name}_sum{labels} {self.values[0]}")
+        lines.append(f"{self.name}_count{labels} {total}")
+        return lines
+
+
+class Registry:
+    def __init__(self):
+        self.metrics: dict[tuple, Counter | Histogram] = {}
+        self.help: dict[str, str] = {}
+
+    def register(self, cls: type, name: str, help: str, labels: dict, *args):
+        key = (name, tuple(labels.items()))
+        if (metric := self.metrics.get(key)) is None:
+            metric = self.metrics[key] = cls(name, labels, *args)
+            self.help.setdefault(name, help)
+        return metric
+
+    def counter(self, name: str, help: str, **labels: str) -> Counter:
+        return self.register(Counter, name, help, labels)
+
+    def gauge(self, name: str, help: str, **labels: str) -> Gauge:
+        return self.register(Gauge, name, help, labels)
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+        **labels: str,
+    ) -> Histogram:
+        return self.register(Histogram, name, help, labels, buckets)
+
+    def render(self) -> bytes:
+        lines, seen = [], set()
+        for (name, _), metric in sorted(self.metrics.items()):
+            if name not in seen:
+                seen.add(name)
+                lines.append(f"# HELP {name} {self.help[name]}")
+                lines.append(f"# TYPE {name} {metric.kind}")
+            lines.extend(metric.render())
+        lines.append("")
+        return "\n".join(lines).encode()
+
+
+registry = Registry()
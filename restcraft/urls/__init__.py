@@ -1,5 +1,6 @@
 from .conf import include, path
 from .matchit import exec_it, match_it, parse_it
+from .router import Router
 
 __all__ = [
     "include",
@@ -7,4 +8,5 @@ __all__ = [
     "exec_it",
     "parse_it",
     "match_it",
+    "Router",
 ]
@@ -0,0 +1,94 @@
+from .matchit import ATYPE, OTYPE, STYPE, _strip, parse_it
+
+
+class Segment:
+    __slots__ = ("type", "val", "end")
+
+    def __init__(self, type: int, val: str, end: str):
+        self.type = type
+        self.val = val
+        self.end = end
+
+
+class Route:
+    __slots__ = ("view", "handler")
+
+    def __init__(self, view: type, handler: str):
+        self.view = view
+        self.handler = handler
+
+
+class Node:
+    __slots__ = ("static", "params", "wildcard", "route")
+
+    def __init__(self):
+        self.static: dict[str, Node] = {}
+        self.params: list[tuple[Segment, Node]] = []
+        self.wildcard: Route | None = None
+        self.route: Route | None = None
+
+    def child(self, segment: Segment) -> "Node":
+        if segment.type == STYPE:
+            return self.static.setdefault(segment.val, Node())
+        for other, node in self.params:
+            if other.val == segment.val and other.end == segment.end:
+                return node
+        node = Node()
+        self.params.append((segment, node))
+        return node
+
+    def match(self, segs: list[str], idx: int, params: dict) -> Route | None:
+        if idx == len(segs):
+            return self.route
+        seg = segs[idx]
+        if (node := self.static.get(seg)) and (
+            route := node.match(segs, idx + 1, params)
+        ):
+            return route
+        for segment, node in self.params:
+            if seg.endswith(segment.end) and (
+                route := node.match(segs, idx + 1, params)
+            ):
+                params[segment.val] = seg.removesuffix(segment.end)
+                return route
+        return self.wildcard
+
+
+class Router:
+    def __init__(self):
+        self.static: dict[str, dict[str, Route]] = {}
+        self.trees: dict[str, Node] = {}
+
+    def add(self, method: str, path: str, view: type, handler: str):
+        route = Route(view, handler)
+        segments = [
+            Segment(rule["type"], rule["val"], rule["end"])
+            for rule in parse_it(path)
+            if rule["val"] != "/"
+        ]
+        if all(segment.type == STYPE for segment in segments):
+            static = self.static.setdefault(method, {})
+            key = "/" + "/".join(segment.val for segment in segments)
+            static.setdefault(key, route)
+            static.setdefault(f"{key}/", route)
+        node = self.trees.setdefault(method, Node())
+        for segment in segments:
+            if segment.type == ATYPE:
+                node.wildcard = node.wildcard or route
+                return
+            parent, node = node, node.child(segment)
+            if segment.type == OTYPE:
+                parent.route = parent.route or route
+        node.route = node.route or route
+
+    def match(self, method: str, path: str) -> tuple[type, str, dict] | None:
+        if (static := self.static.get(method)) and (route := static.get(path)):
+            return route.view, route.handler, {}
+        if not (tree := self.trees.get(method)):
+            return None
+        stripped = _strip(path)
+        segs = [] if stripped in ("", "/") else stripped.split("/")
+        params = {}
+        if route := tree.match(segs, 0, params):
+            return route.view, route.handler, params
+        return None
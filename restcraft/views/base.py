@@ -9,6 +9,7 @@ class View:
 
     query_params_serializer = ...
     body_serializer = ...
+    stateless = False
 
     @property
     def ctx(self):
@@ -22,26 +23,29 @@ class View:
     def request(self) -> Request:
         return self.ctx["request"]
 
-    def get_data(self) -> dict[str, Any]:
-        if self.request.method in ("POST", "PUT", "PATCH"):
-            return self.request.body
+    def get_data(self, request: Request = None) -> dict[str, Any]:
+        request = request or self.request
+        if request.method in ("POST", "PUT", "PATCH"):
+            return request.body
         else:
-            return self.request.query_params
+            return request.query_params
 
-    def validated_query_params(self, raise_=False):
+    def validated_query_params(self, raise_=False, request: Request = None):
+        request = request or self.request
         if serializer := getattr(self, "query_params_serializer", None):
-            instance = serializer(data=self.request.query_params)
+            instance = serializer(data=request.query_params)
             is_valid = instance.is_valid()
             if raise_ and not is_valid:
                 raise ValidationError(instance.errors)
             return instance.validated_data, instance.errors
-        return self.request.query_params, None
+        return request.query_params, None
 
-    def validated_body(self, raise_=False):
+    def validated_body(self, raise_=False, request: Request = None):
+        request = request or self.request
         if serializer := getattr(self, "body_serializer", None):
-            instance = serializer(data=self.request.body)
+            instance = serializer(data=request.body)
             is_valid = instance.is_valid()
             if raise_ and not is_valid:
                 raise ValidationError(instance.errors)
             return instance.validated_data, instance.errors
-        return self.request.body, None
+        return request.body, None
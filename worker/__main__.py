@@ -1,75 +1,208 @@
+import signal
+import time
 import traceback
 from datetime import UTC, datetime
 
 import gevent
-import msgpack
-import requests
-from requests.adapters import HTTPAdapter
+import orjson
 
+from common.codec import unpack_payment
+from restcraft.metrics import registry
+
+from .breaker import CircuitBreaker
+from .clients import Client, ClientError, make_client
 from .config import Config
-from .keydb import keydb
+from .dispatcher import Dispatcher
+from .health import HealthMonitor
+from .limiter import ConcurrencyLimiter
+from .metrics import serve_metrics
+from .pool import WorkerPool
+from .retry import schedule_retry, scheduler
+from .routing import RoutingEngine
+from .storage import PaymentWriter
 
 processors = (
-    ("default", Config.DEFAULT_PAYMENT_URL),
-    ("default", Config.DEFAULT_PAYMENT_URL),
-    ("fallback", Config.FALLBACK_PAYMENT_URL),
+    ("default", make_client(Config.DEFAULT_PAYMENT_URL)),
+    ("fallback", make_client(Config.FALLBACK_PAYMENT_URL)),
 )
 
-
-def get_sesstion():
-    adapter = HTTPAdapter(
-        pool_connections=Config.NUM_WORKERS,
-        pool_maxsize=Config.NUM_WORKERS,
+clients = dict(processors)
+health = HealthMonitor(processors)
+breakers = {processor: CircuitBreaker(processor) for processor, _ in processors}
+limiters = {processor: ConcurrencyLimiter(processor) for processor, _ in processors}
+post_durations = {
+    processor: registry.histogram(
+        "processor_request_duration_seconds",
+        "Time spent posting payments to a processor.",
+        processor=processor,
     )
-    session = requests.Session()
-    session.mount("https://", adapter)
-    session.mount("http://", adapter)
-    return session
-
-
-def store_payment(payment: dict, processor: str, timestamp: float):
-    member = f"{processor}:{payment['amount']}:{payment['correlation_id']}"
-    keydb.zadd("payments", {member: timestamp})
-
-
-def process_payment(payment: dict, session: requests.Session):
-    requested_at = datetime.now(UTC)
-    timestamp = requested_at.timestamp()
-    payload = {
-        "correlationId": payment["correlation_id"],
-        "amount": payment["amount"],
-        "requestedAt": requested_at.isoformat(),
-    }
-    for processor, url in processors:
-        resp = session.post(
-            f"{url}/payments",
-            json=payload,
+    for processor, _ in processors
+}
+pool_size = registry.gauge("worker_pool_size", "Payment greenlets currently running.")
+routing = RoutingEngine(processors, health, breakers, limiters)
+dispatcher = Dispatcher()
+writer = PaymentWriter(dispatcher)
+
+
+def verify(payment: dict, client: Client) -> bool | None:
+    try:
+        status, _ = client.get(
+            f"/payments/{payment['correlation_id']}", timeout=Config.VERIFY_TIMEOUT
         )
-        if resp.status_code == 200:
-            store_payment(payment, processor, timestamp)
-            return
-    gevent.sleep(0.05)
-    process_payment(payment, session)
+    except ClientError:
+        return None
+    if status == 200:
+        return True
+    if status == 404:
+        return False
+    return None
+
+
+def encode_body(payment: dict, timestamp: float) -> bytes:
+    return orjson.dumps(
+        {
+            "correlationId": payment["correlation_id"],
+            "amount": payment["amount"],
+            "requestedAt": datetime.fromtimestamp(timestamp, UTC).isoformat(),
+        }
+    )
+
+
+def post(
+    processor: str, client: Client, body: bytes, timeout: float
+) -> tuple[int | None, bool]:
+    started = time.monotonic()
+    try:
+        status, _ = client.post("/payments", body, timeout)
+        sent = True
+    except ClientError as e:
+        status, sent = None, e.sent
+    elapsed = time.monotonic() - started
+    post_durations[processor].observe(elapsed)
+    limiters[processor].record(elapsed, status == 200)
+    return status, sent
+
+
+def park(payment: dict, processor: str, timestamp: float, timeout: float):
+    payment["pending"] = processor
+    payment["requested_at"] = timestamp
+    payment["settle_at"] = time.time() + timeout
 
 
-def worker():
-    session = get_sesstion()
+def settle(payment: dict, payment_data: bytes) -> bool | None:
+    processor = payment["pending"]
+    client = clients[processor]
+    timestamp = payment["requested_at"]
+    if time.time() >= payment["settle_at"]:
+        paid = verify(payment, client)
+        if paid:
+            writer.store(payment, payment_data, processor, timestamp)
+            return True
+        if paid is False:
+            del payment["pending"], payment["requested_at"], payment["settle_at"]
+            return None
+    timeout = health.timeout(processor)
+    status, sent = post(processor, client, encode_body(payment, timestamp), timeout)
+    if status in (200, 422):
+        writer.store(payment, payment_data, processor, timestamp)
+        return True
+    if sent and status is None:
+        payment["settle_at"] = time.time() + timeout
+    return False
+
+
+def process_payment(payment: dict, payment_data: bytes) -> bool:
+    if payment.get("pending"):
+        settled = settle(payment, payment_data)
+        if settled is not None:
+            return settled
+    timestamp = time.time()
+    body = encode_body(payment, timestamp)
+    for processor, client in routing.route():
+        breaker = breakers[processor]
+        if (epoch := breaker.allow()) is None:
+            continue
+        timeout = health.timeout(processor)
+        budget = timeout
+        if Config.PARK_AFTER > 0:
+            budget = min(timeout, Config.PARK_AFTER)
+        status, sent = post(processor, client, body, budget)
+        if not sent:
+            breaker.record_failure(epoch)
+            continue
+        if status in (200, 422):
+            breaker.record_success(epoch)
+            writer.store(payment, payment_data, processor, timestamp)
+            return True
+        if status is not None:
+            breaker.record_failure(epoch)
+            continue
+        if budget == timeout:
+            breaker.record_failure(epoch)
+        park(payment, processor, timestamp, timeout)
+        return False
+    return False
+
+
+def work(payment_data: bytes):
+    try:
+        payment = unpack_payment(payment_data)
+    except ValueError:
+        payment = None
+    try:
+        if payment is None:
+            print(f"[Worker] Dead-lettering undecodable payment: {payment_data!r}")
+            dispatcher.dead_letter(payment_data)
+        elif not process_payment(payment, payment_data):
+            schedule_retry(payment, payment_data, dispatcher)
+    except Exception:
+        print("[Worker] Unexpected error:")
+        traceback.print_exc()
+
+
+pool = WorkerPool(dispatcher.get, work)
+
+
+def scale():
     while True:
-        try:
-            _, payment_data = keydb.brpop("queue:payments", timeout=0)
-            payment = msgpack.unpackb(payment_data, raw=False)
-            process_payment(payment, session)
-        except requests.HTTPError:
-            print("[Worker] Unexpected HTTPError:")
-            traceback.print_exc()
-        except Exception:
-            print("[Worker] Unexpected error:")
-            traceback.print_exc()
-        gevent.sleep(0.05)
+        if candidates := routing.route():
+            pool.resize(round(limiters[candidates[0][0]].limit))
+        pool_size.set(pool.size)
+        gevent.sleep(Config.SCALE_INTERVAL)
+
+
+def shutdown(greenlets: list[gevent.Greenlet]):
+    print("[Worker] Shutting down, draining in-flight payments...")
+    gevent.killall(greenlets)
+    if busy := pool.stop(Config.SHUTDOWN_TIMEOUT):
+        print(f"[Worker] Killed {busy} payments still in flight.")
+    try:
+        if released := dispatcher.release():
+            print(f"[Worker] Returned {released} undispatched payments to the queue.")
+    except Exception:
+        print("[Worker] Failed to return undispatched payments:")
+        traceback.print_exc()
+    print("[Worker] Flushing stored payments...")
+    writer.stop()
 
 
 if __name__ == "__main__":
     print("[Worker] Starting workers...")
-    gevent.joinall(
-        [gevent.spawn(worker) for _ in range(Config.NUM_WORKERS)],
-    )
+    dispatcher.recover()
+    greenlets = [
+        gevent.spawn(health.run),
+        gevent.spawn(routing.run),
+        gevent.spawn(scheduler),
+        gevent.spawn(dispatcher.run),
+    ]
+    if dispatcher.processing_key:
+        greenlets.append(gevent.spawn(dispatcher.heartbeat))
+    pool.resize(Config.NUM_WORKERS)
+    if Config.ADAPTIVE_WORKERS:
+        greenlets.append(gevent.spawn(scale))
+    if Config.METRICS_PORT:
+        greenlets.append(gevent.spawn(serve_metrics))
+    flusher = gevent.spawn(writer.run)
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        gevent.signal_handler(signum, gevent.spawn, shutdown, greenlets)
+    flusher.join()
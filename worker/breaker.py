@@ -0,0 +1,80 @@
+import time
+from collections import deque
+
+from .config import Config
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half-open"
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        name: str,
+        window: int = Config.BREAKER_WINDOW,
+        min_calls: int = Config.BREAKER_MIN_CALLS,
+        failure_rate: float = Config.BREAKER_FAILURE_RATE,
+        cooldown: float = Config.BREAKER_COOLDOWN,
+        half_open_max: int = Config.BREAKER_HALF_OPEN_MAX,
+    ):
+        self.name = name
+        self.min_calls = min_calls
+        self.failure_rate = failure_rate
+        self.cooldown = cooldown
+        self.half_open_max = half_open_max
+        self.state = CLOSED
+        self.results: deque[bool] = deque(maxlen=window)
+        self.changed_at = 0.0
+        self.probes = 0
+        self.probe_successes = 0
+        self.epoch = 0
+
+    def transition(self, state: str):
+        print(f"[Breaker] {self.name}: {self.state} -> {state}")
+        self.state = state
+        self.results.clear()
+        self.probes = 0
+        self.probe_successes = 0
+        self.changed_at = time.monotonic()
+        self.epoch += 1
+
+    def is_open(self) -> bool:
+        return self.state == OPEN and time.monotonic() - self.changed_at < self.cooldown
+
+    def allow(self) -> int | None:
+        if self.state == OPEN:
+            if time.monotonic() - self.changed_at < self.cooldown:
+                return None
+            self.transition(HALF_OPEN)
+        if self.state == HALF_OPEN:
+            if self.probes >= self.half_open_max:
+                if time.monotonic() - self.changed_at < self.cooldown:
+                    return None
+                self.transition(HALF_OPEN)
+            self.probes += 1
+        return self.epoch
+
+    def record_success(self, epoch: int):
+        if epoch != self.epoch or self.state == OPEN:
+            return
+        if self.state == HALF_OPEN:
+            self.probe_successes += 1
+            if self.probe_successes >= self.half_open_max:
+                self.transition(CLOSED)
+            return
+        self.results.append(True)
+
+    def record_failure(self, epoch: int):
+        if epoch != self.epoch or self.state == OPEN:
+            return
+        if self.state == HALF_OPEN:
+            self.transition(OPEN)
+            return
+        self.results.append(False)
+        calls = len(self.results)
+        if (
+            calls >= self.min_calls
+            and self.results.count(False) / calls >= self.failure_rate
+        ):
+            self.transition(OPEN)
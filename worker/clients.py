@@ -0,0 +1,175 @@
+import socket
+import time
+from urllib.parse import urlsplit
+
+import requests
+from gevent.lock import BoundedSemaphore
+from requests.adapters import HTTPAdapter
+
+from .config import Config
+
+
+class ClientError(Exception):
+    def __init__(self, message: str, sent: bool = False):
+        super().__init__(message)
+        self.sent = sent
+
+
+class RequestsClient:
+    def __init__(self, url: str, pool_size: int):
+        self.url = url.rstrip("/")
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session = requests.Session()
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def get(self, path: str, timeout: float = None) -> tuple[int, bytes]:
+        try:
+            resp = self.session.get(f"{self.url}{path}", timeout=timeout)
+        except requests.RequestException as e:
+            raise ClientError(
+                str(e), sent=not isinstance(e, requests.ConnectionError)
+            ) from e
+        return resp.status_code, resp.content
+
+    def post(self, path: str, body: bytes, timeout: float = None) -> tuple[int, bytes]:
+        try:
+            resp = self.session.post(
+                f"{self.url}{path}",
+                data=body,
+                headers={"Content-Type": "application/json"},
+                timeout=timeout,
+            )
+        except requests.RequestException as e:
+            raise ClientError(
+                str(e), sent=not isinstance(e, requests.ConnectionError)
+            ) from e
+        return resp.status_code, resp.content
+
+
+class RawClient:
+    def __init__(self, url: str, pool_size: int):
+        parts = urlsplit(url)
+        self.address = (parts.hostname, parts.port or 80)
+        self.host = parts.netloc.encode()
+        self.prefix = parts.path.rstrip("/").encode()
+        self.slots = BoundedSemaphore(pool_size)
+        self.idle: list[socket.socket] = []
+        self.head = (
+            b" HTTP/1.1\r\nHost: "
+            + self.host
+            + b"\r\nContent-Type: application/json\r\nContent-Length: "
+        )
+
+    def template(self, method: bytes, path: str) -> bytes:
+        return method + b" " + self.prefix + path.encode() + self.head
+
+    def remaining(self, deadline: float | None) -> float | None:
+        if deadline is None:
+            return None
+        if (left := deadline - time.monotonic()) <= 0:
+            raise TimeoutError("Processor request timed out.")
+        return left
+
+    def connect(self, deadline: float | None) -> socket.socket:
+        sock = socket.create_connection(self.address, self.remaining(deadline))
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        return sock
+
+    def recv(self, sock: socket.socket, deadline: float | None) -> bytes:
+        sock.settimeout(self.remaining(deadline))
+        if not (chunk := sock.recv(65536)):
+            raise ConnectionResetError("Connection closed by processor.")
+        return chunk
+
+    def read_response(
+        self, sock: socket.socket, deadline: float | None
+    ) -> tuple[int, bytes, bool]:
+        buf = b""
+        while (end := buf.find(b"\r\n\r\n")) < 0:
+            buf += self.recv(sock, deadline)
+        head, body = buf[:end], buf[end + 4 :]
+        status = int(head[9:12])
+        length, chunked, keep_alive = None, False, True
+        for line in head.split(b"\r\n")[1:]:
+            name, _, value = line.partition(b":")
+            name = name.strip().lower()
+            if name == b"content-length":
+                length = int(value)
+            elif name == b"transfer-encoding":
+                chunked = b"chunked" in value.lower()
+            elif name == b"connection":
+                keep_alive = value.strip().lower() != b"close"
+        if chunked:
+            while not body.endswith(b"0\r\n\r\n"):
+                body += self.recv(sock, deadline)
+            return status, self.dechunk(body), keep_alive
+        if length is None:
+            return status, body, False
+        while len(body) < length:
+            body += self.recv(sock, deadline)
+        return status, body, keep_alive
+
+    def dechunk(self, body: bytes) -> bytes:
+        out = []
+        while True:
+            size_line, _, body = body.partition(b"\r\n")
+            size = int(size_line.split(b";", 1)[0], 16)
+            if not size:
+                return b"".join(out)
+            out.append(body[:size])
+            body = body[size + 2 :]
+
+    def request(
+        self, method: bytes, path: str, body: bytes, timeout: float = None
+    ) -> tuple[int, bytes]:
+        message = self.template(method, path) + b"%d\r\n\r\n" % len(body) + body
+        deadline = None if timeout is None else time.monotonic() + timeout
+        if not self.slots.acquire(timeout=timeout):
+            raise ClientError("Processor connection pool exhausted.")
+        try:
+            while True:
+                reused, sent = bool(self.idle), False
+                sock = self.idle.pop() if reused else None
+                try:
+                    sock = sock or self.connect(deadline)
+                    sock.settimeout(self.remaining(deadline))
+                    sock.sendall(message)
+                    sent = True
+                    status, data, keep_alive = self.read_response(sock, deadline)
+                except OSError as e:
+                    if sock is not None:
+                        sock.close()
+                    if reused and isinstance(e, ConnectionError):
+                        continue
+                    raise ClientError(str(e), sent=sent) from e
+                except (ValueError, IndexError) as e:
+                    sock.close()
+                    raise ClientError(
+                        f"Malformed processor response: {e}", sent=True
+                    ) from e
+                if keep_alive:
+                    self.idle.append(sock)
+                else:
+                    sock.close()
+                return status, data
+        finally:
+            self.slots.release()
+
+    def get(self, path: str, timeout: float = None) -> tuple[int, bytes]:
+        return self.request(b"GET", path, b"", timeout)
+
+    def post(self, path: str, body: bytes, timeout: float = None) -> tuple[int, bytes]:
+        return self.request(b"POST", path, body, timeout)
+
+
+Client = RawClient | RequestsClient
+
+CLIENTS = {
+    "raw": RawClient,
+    "requests": RequestsClient,
+}
+
+
+def make_client(url: str) -> Client:
+    return CLIENTS[Config.HTTP_CLIENT](url, Config.HTTP_POOL_SIZE)
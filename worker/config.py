@@ -1,4 +1,5 @@
 import os
+import socket
 from collections.abc import Callable
 from typing import Any, TypeVar
 
@@ -9,10 +10,69 @@ def env(key: str, default: Any = None, parse: Callable[[str], T] = str) -> T:
     return parse(os.getenv(key, default))
 
 
+def boolean(value: str) -> bool:
+    return value.lower() in ("1", "true", "yes", "on")
+
+
 class Config:
     DEFAULT_PAYMENT_URL = env("DEFAULT_PAYMENT_URL", "http://localhost:8001")
     FALLBACK_PAYMENT_URL = env("FALLBACK_PAYMENT_URL", "http://localhost:8002")
 
+    DEFAULT_FEE = env("DEFAULT_FEE", "0.05", float)
+    FALLBACK_FEE = env("FALLBACK_FEE", "0.15", float)
+
+    ROUTING_POLICY = env("ROUTING_POLICY", "cost")
+    ROUTING_MAX_WAIT = env("ROUTING_MAX_WAIT", "1", float)
+    QUEUE_POLL_INTERVAL = env("QUEUE_POLL_INTERVAL", "0.1", float)
+
     KEYDB_URL = env("KEYDB_URL", "redis://localhost")
 
     NUM_WORKERS = env("NUM_WORKERS", "30", int)
+    ADAPTIVE_WORKERS = env("ADAPTIVE_WORKERS", "true", boolean)
+    MIN_WORKERS = env("MIN_WORKERS", "4", int)
+    MAX_WORKERS = env("MAX_WORKERS", "200", int)
+    SCALE_INTERVAL = env("SCALE_INTERVAL", "0.1", float)
+    LIMIT_TOLERANCE = env("LIMIT_TOLERANCE", "1.5", float)
+    LIMIT_BACKOFF = env("LIMIT_BACKOFF", "0.9", float)
+    LIMIT_DRIFT = env("LIMIT_DRIFT", "0.01", float)
+    MAX_CONCURRENCY = MAX_WORKERS if ADAPTIVE_WORKERS else NUM_WORKERS
+    HTTP_CLIENT = env("HTTP_CLIENT", "raw")
+    HTTP_POOL_SIZE = env("HTTP_POOL_SIZE", str(MAX_CONCURRENCY), int)
+    KEYDB_POOL_SIZE = env("KEYDB_POOL_SIZE", str(MAX_CONCURRENCY + 8), int)
+    WORKER_ID = env("WORKER_ID", socket.gethostname())
+
+    HEALTH_CHECK_INTERVAL = env("HEALTH_CHECK_INTERVAL", "5", float)
+    HEALTH_SYNC_INTERVAL = env("HEALTH_SYNC_INTERVAL", "1", float)
+    HEALTH_SHARED = env("HEALTH_SHARED", "true", boolean)
+
+    PAYMENT_TIMEOUT_BASE = env("PAYMENT_TIMEOUT_BASE", "0.5", float)
+    PAYMENT_TIMEOUT_FACTOR = env("PAYMENT_TIMEOUT_FACTOR", "2", float)
+    PAYMENT_TIMEOUT_MAX = env("PAYMENT_TIMEOUT_MAX", "5", float)
+    VERIFY_TIMEOUT = env("VERIFY_TIMEOUT", "1", float)
+    PARK_AFTER = env("PARK_AFTER", "0", float)
+
+    BREAKER_WINDOW = env("BREAKER_WINDOW", "20", int)
+    BREAKER_MIN_CALLS = env("BREAKER_MIN_CALLS", "10", int)
+    BREAKER_FAILURE_RATE = env("BREAKER_FAILURE_RATE", "0.5", float)
+    BREAKER_COOLDOWN = env("BREAKER_COOLDOWN", "1", float)
+    BREAKER_HALF_OPEN_MAX = env("BREAKER_HALF_OPEN_MAX", "2", int)
+
+    RETRY_BASE_DELAY = env("RETRY_BASE_DELAY", "0.05", float)
+    RETRY_MAX_DELAY = env("RETRY_MAX_DELAY", "2", float)
+    RETRY_BATCH_SIZE = env("RETRY_BATCH_SIZE", "100", int)
+    RETRY_POLL_INTERVAL = env("RETRY_POLL_INTERVAL", "0.05", float)
+
+    DEQUEUE_BATCH_SIZE = env("DEQUEUE_BATCH_SIZE", "50", int)
+    DEQUEUE_BLOCK_TIMEOUT = env("DEQUEUE_BLOCK_TIMEOUT", "1", float)
+    LOCAL_QUEUE_SIZE = env("LOCAL_QUEUE_SIZE", "100", int)
+
+    RELIABLE_QUEUE = env("RELIABLE_QUEUE", "false", boolean)
+    WORKER_HEARTBEAT_INTERVAL = env("WORKER_HEARTBEAT_INTERVAL", "1", float)
+    WORKER_DEAD_AFTER = env("WORKER_DEAD_AFTER", "10", float)
+
+    SHUTDOWN_TIMEOUT = env("SHUTDOWN_TIMEOUT", "5", float)
+
+    METRICS_PORT = env("METRICS_PORT", "0", int)
+
+    STORE_BATCH_SIZE = env("STORE_BATCH_SIZE", "100", int)
+    STORE_FLUSH_INTERVAL = env("STORE_FLUSH_INTERVAL", "0.005", float)
@@ -0,0 +1,141 @@
+import time
+import traceback
+from collections import deque
+
+import gevent
+from gevent.queue import Empty, Queue
+from redis.client import Pipeline
+
+from common.store import DEAD_KEY, PROCESSING_KEY, QUEUE_KEY, WORKERS_KEY
+
+from .config import Config
+from .keydb import keydb
+
+pop_batch = keydb.register_script(
+    """
+    local items = redis.call('RPOP', KEYS[1], ARGV[1])
+    if not items then
+        return {}
+    end
+    redis.call('LPUSH', KEYS[2], unpack(items))
+    return items
+    """
+)
+
+requeue = keydb.register_script(
+    """
+    local moved = 0
+    while true do
+        local items = redis.call('LRANGE', KEYS[1], 0, 999)
+        if #items == 0 then
+            break
+        end
+        redis.call('RPUSH', KEYS[2], unpack(items))
+        redis.call('LTRIM', KEYS[1], #items, -1)
+        moved = moved + #items
+    end
+    return moved
+    """
+)
+
+
+class Dispatcher:
+    def __init__(self):
+        self.queue = Queue(maxsize=Config.LOCAL_QUEUE_SIZE)
+        self.backlog: deque[bytes] = deque()
+        self.processing_key = None
+        if Config.RELIABLE_QUEUE:
+            self.processing_key = f"{PROCESSING_KEY}:{Config.WORKER_ID}"
+
+    def fetch(self) -> list[bytes]:
+        if self.processing_key:
+            return self.fetch_reliable()
+        items = keydb.rpop(QUEUE_KEY, Config.DEQUEUE_BATCH_SIZE)
+        if items:
+            return items
+        item = keydb.brpop(QUEUE_KEY, timeout=Config.DEQUEUE_BLOCK_TIMEOUT)
+        return [item[1]] if item else []
+
+    def fetch_reliable(self) -> list[bytes]:
+        items = pop_batch(
+            keys=[QUEUE_KEY, self.processing_key],
+            args=[Config.DEQUEUE_BATCH_SIZE],
+        )
+        if items:
+            return items
+        item = keydb.blmove(
+            QUEUE_KEY,
+            self.processing_key,
+            Config.DEQUEUE_BLOCK_TIMEOUT,
+            src="RIGHT",
+            dest="LEFT",
+        )
+        return [item] if item else []
+
+    def ack(self, pipe: Pipeline, payment_data: bytes):
+        if self.processing_key:
+            pipe.lrem(self.processing_key, 1, payment_data)
+
+    def dead_letter(self, payment_data: bytes):
+        pipe = keydb.pipeline(transaction=False)
+        pipe.rpush(DEAD_KEY, payment_data)
+        self.ack(pipe, payment_data)
+        pipe.execute()
+
+    def heartbeat(self):
+        while True:
+            try:
+                keydb.hset(WORKERS_KEY, Config.WORKER_ID, time.time())
+            except Exception:
+                print("[Dispatcher] Heartbeat failed:")
+                traceback.print_exc()
+            gevent.sleep(Config.WORKER_HEARTBEAT_INTERVAL)
+
+    def recover(self):
+        if not self.processing_key:
+            return
+        deadline = time.time() - Config.WORKER_DEAD_AFTER
+        stale = [
+            worker_id.decode()
+            for worker_id, seen in keydb.hgetall(WORKERS_KEY).items()
+            if float(seen) < deadline
+        ]
+        for worker_id in {Config.WORKER_ID, *stale}:
+            moved = requeue(keys=[f"{PROCESSING_KEY}:{worker_id}", QUEUE_KEY])
+            if moved:
+                print(f"[Dispatcher] Recovered {moved} payments from {worker_id}.")
+        if stale:
+            keydb.hdel(WORKERS_KEY, *stale)
+
+    def release(self) -> int:
+        items = []
+        while True:
+            try:
+                items.append(self.queue.get_nowait())
+            except Empty:
+                break
+        items.extend(self.backlog)
+        self.backlog.clear()
+        if not items:
+            return 0
+        pipe = keydb.pipeline(transaction=False)
+        pipe.rpush(QUEUE_KEY, *reversed(items))
+        for item in items:
+            self.ack(pipe, item)
+        pipe.execute()
+        return len(items)
+
+    def get(self) -> bytes:
+        return self.queue.get()
+
+    def run(self):
+        while True:
+            try:
+                self.backlog.extend(self.fetch())
+                while self.backlog:
+                    self.queue.put(self.backlog[0])
+                    self.backlog.popleft()
+            except Exception:
+                print("[Dispatcher] Unexpected error:")
+                traceback.print_exc()
+                gevent.sleep(Config.DEQUEUE_BLOCK_TIMEOUT)
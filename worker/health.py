@@ -0,0 +1,109 @@
+import traceback
+
+import gevent
+import orjson
+
+from .clients import Client, ClientError
+from .config import Config
+from .keydb import keydb
+
+
+class HealthMonitor:
+    def __init__(self, processors: tuple[tuple[str, Client], ...]):
+        self.processors = processors
+        self.state = {
+            name: {"failing": False, "min_response_time": 0} for name, _ in processors
+        }
+
+    def is_healthy(self, processor: str) -> bool:
+        return not self.state[processor]["failing"]
+
+    def min_response_time(self, processor: str) -> int:
+        return self.state[processor]["min_response_time"]
+
+    def timeout(self, processor: str) -> float:
+        return min(
+            Config.PAYMENT_TIMEOUT_MAX,
+            Config.PAYMENT_TIMEOUT_BASE
+            + Config.PAYMENT_TIMEOUT_FACTOR * self.min_response_time(processor) / 1000,
+        )
+
+    def check(self, processor: str, client: Client):
+        try:
+            status, body = client.get(
+                "/payments/service-health",
+                timeout=Config.HEALTH_CHECK_INTERVAL,
+            )
+        except ClientError:
+            self.state[processor] = {
+                "failing": True,
+                "min_response_time": self.min_response_time(processor),
+            }
+            return
+        if status != 200:
+            return
+        data = orjson.loads(body)
+        self.state[processor] = {
+            "failing": bool(data["failing"]),
+            "min_response_time": int(data["minResponseTime"]),
+        }
+
+    def publish(self):
+        pipe = keydb.pipeline()
+        pipe.set(
+            "health:lock",
+            Config.WORKER_ID,
+            px=int(Config.HEALTH_CHECK_INTERVAL * 1000),
+        )
+        for processor, state in self.state.items():
+            pipe.hset(
+                f"health:{processor}",
+                mapping={
+                    "failing": int(state["failing"]),
+                    "min_response_time": state["min_response_time"],
+                },
+            )
+        pipe.execute()
+
+    def load(self):
+        pipe = keydb.pipeline()
+        for processor in self.state:
+            pipe.hgetall(f"health:{processor}")
+        for processor, data in zip(self.state, pipe.execute(), strict=True):
+            if not data:
+                continue
+            self.state[processor] = {
+                "failing": data[b"failing"] == b"1",
+                "min_response_time": int(data[b"min_response_time"]),
+            }
+
+    def acquire(self) -> bool:
+        if not Config.HEALTH_SHARED:
+            return True
+        return bool(
+            keydb.set(
+                "health:lock",
+                Config.WORKER_ID,
+                nx=True,
+                px=int(
+                    Config.HEALTH_CHECK_INTERVAL * 1000 * (len(self.processors) + 1)
+                ),
+            )
+        )
+
+    def run(self):
+        while True:
+            interval = Config.HEALTH_SYNC_INTERVAL
+            try:
+                if self.acquire():
+                    for processor, client in self.processors:
+                        self.check(processor, client)
+                    if Config.HEALTH_SHARED:
+                        self.publish()
+                    interval = Config.HEALTH_CHECK_INTERVAL
+                else:
+                    self.load()
+            except Exception:
+                print("[Health] Unexpected error:")
+                traceback.print_exc()
+            gevent.sleep(interval)
@@ -1,4 +1,4 @@
-from redis import ConnectionPool, StrictRedis
+from redis import BlockingConnectionPool, StrictRedis
 
 from .config import Config
 
@@ -6,18 +6,18 @@ if Config.KEYDB_URL.startswith("unix:"):
     from redis import UnixDomainSocketConnection
 
     keydb = StrictRedis(
-        connection_pool=ConnectionPool(
+        connection_pool=BlockingConnectionPool(
             connection_class=UnixDomainSocketConnection,
             path=Config.KEYDB_URL.replace("unix:", ""),
-            max_connections=Config.NUM_WORKERS,
+            max_connections=Config.KEYDB_POOL_SIZE,
         ),
         protocol=3,
     )
 else:
     keydb = StrictRedis(
-        connection_pool=ConnectionPool.from_url(
+        connection_pool=BlockingConnectionPool.from_url(
             Config.KEYDB_URL,
-            max_connections=Config.NUM_WORKERS,
+            max_connections=Config.KEYDB_POOL_SIZE,
         ),
         protocol=3,
     )
@@ -0,0 +1,40 @@
+import time
+
+from .config import Config
+
+
+class ConcurrencyLimiter:
+    def __init__(
+        self,
+        name: str,
+        initial: int = Config.NUM_WORKERS,
+        min_limit: int = Config.MIN_WORKERS,
+        max_limit: int = Config.MAX_WORKERS,
+        tolerance: float = Config.LIMIT_TOLERANCE,
+        backoff: float = Config.LIMIT_BACKOFF,
+        drift: float = Config.LIMIT_DRIFT,
+    ):
+        self.name = name
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.tolerance = tolerance
+        self.backoff = backoff
+        self.drift = drift
+        self.limit = float(min(max(initial, min_limit), max_limit))
+        self.baseline = 0.0
+        self.decreased_at = 0.0
+
+    def record(self, rtt: float, ok: bool):
+        if ok:
+            if not self.baseline or rtt < self.baseline:
+                self.baseline = rtt
+            else:
+                self.baseline += (rtt - self.baseline) * self.drift
+            if rtt <= self.baseline * self.tolerance:
+                self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+                return
+        now = time.monotonic()
+        if now - self.decreased_at < max(rtt, self.baseline):
+            return
+        self.decreased_at = now
+        self.limit = max(self.min_limit, self.limit * self.backoff)
@@ -0,0 +1,25 @@
+from gevent.pywsgi import WSGIServer
+
+from restcraft.metrics import registry
+
+from .config import Config
+
+
+def metrics_app(environ: dict, start_response):
+    if environ.get("PATH_INFO") != "/metrics":
+        start_response("404 Not Found", [("Content-Length", "0")])
+        return []
+    body = registry.render()
+    start_response(
+        "200 OK",
+        [
+            ("Content-Type", "text/plain; version=0.0.4"),
+            ("Content-Length", str(len(body))),
+        ],
+    )
+    return [body]
+
+
+def serve_metrics():
+    print(f"[Metrics] Listening on :{Config.METRICS_PORT}")
+    WSGIServer(("0.0.0.0", Config.METRICS_PORT), metrics_app, log=None).serve_forever()
@@ -0,0 +1,47 @@
+from collections.abc import Callable
+
+import gevent
+
+
+class WorkerPool:
+    def __init__(self, source: Callable[[], bytes], handle: Callable[[bytes], None]):
+        self.source = source
+        self.handle = handle
+        self.greenlets: set[gevent.Greenlet] = set()
+        self.idle: set[gevent.Greenlet] = set()
+        self.retiring = 0
+
+    @property
+    def size(self) -> int:
+        return len(self.greenlets) - self.retiring
+
+    def loop(self):
+        current = gevent.getcurrent()
+        while True:
+            if self.retiring:
+                self.retiring -= 1
+                return
+            self.idle.add(current)
+            item = self.source()
+            self.idle.discard(current)
+            self.handle(item)
+
+    def resize(self, size: int):
+        if size < self.size:
+            self.retiring += self.size - size
+            return
+        revived = min(self.retiring, size - self.size)
+        self.retiring -= revived
+        for _ in range(size - self.size):
+            greenlet = gevent.spawn(self.loop)
+            greenlet.link(self.greenlets.discard)
+            greenlet.link(self.idle.discard)
+            self.greenlets.add(greenlet)
+
+    def stop(self, timeout: float) -> int:
+        self.retiring = len(self.greenlets)
+        gevent.killall(list(self.idle))
+        gevent.joinall(list(self.greenlets), timeout=timeout)
+        busy = len(self.greenlets)
+        gevent.killall(list(self.greenlets))
+        return busy
@@ -0,0 +1,61 @@
+import random
+import time
+import traceback
+
+import gevent
+
+from common.codec import pack_payment
+from common.store import QUEUE_KEY, RETRY_KEY
+from restcraft.metrics import registry
+
+from .config import Config
+from .dispatcher import Dispatcher
+from .keydb import keydb
+
+release_due = keydb.register_script(
+    """
+    local items = redis.call(
+        'ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, ARGV[2]
+    )
+    if #items > 0 then
+        redis.call('ZREM', KEYS[1], unpack(items))
+        redis.call('RPUSH', KEYS[2], unpack(items))
+    end
+    return #items
+    """
+)
+
+retries = registry.counter("payment_retries_total", "Payments scheduled for retry.")
+
+
+def backoff(attempt: int) -> float:
+    delay = min(Config.RETRY_MAX_DELAY, Config.RETRY_BASE_DELAY * 2**attempt)
+    return random.uniform(delay / 2, delay)
+
+
+def schedule_retry(payment: dict, payment_data: bytes, dispatcher: Dispatcher):
+    attempt = payment.get("attempt", 0)
+    retries.inc()
+    payment["attempt"] = attempt + 1
+    pipe = keydb.pipeline(transaction=False)
+    pipe.zadd(
+        RETRY_KEY,
+        {pack_payment(payment): time.time() + backoff(attempt)},
+    )
+    dispatcher.ack(pipe, payment_data)
+    pipe.execute()
+
+
+def scheduler():
+    while True:
+        moved = 0
+        try:
+            moved = release_due(
+                keys=[RETRY_KEY, QUEUE_KEY],
+                args=[time.time(), Config.RETRY_BATCH_SIZE],
+            )
+        except Exception:
+            print("[Retry] Unexpected error:")
+            traceback.print_exc()
+        if moved < Config.RETRY_BATCH_SIZE:
+            gevent.sleep(Config.RETRY_POLL_INTERVAL)
@@ -0,0 +1,115 @@
+import traceback
+
+import gevent
+
+from common.store import QUEUE_KEY
+from restcraft.metrics import registry
+
+from .breaker import CircuitBreaker
+from .clients import Client
+from .config import Config
+from .health import HealthMonitor
+from .keydb import keydb
+from .limiter import ConcurrencyLimiter
+
+
+class ProcessorState:
+    __slots__ = ("name", "healthy", "fee", "latency", "limit")
+
+    def __init__(
+        self, name: str, healthy: bool, fee: float, latency: float, limit: float
+    ):
+        self.name = name
+        self.healthy = healthy
+        self.fee = fee
+        self.latency = latency
+        self.limit = limit
+
+    def eta(self, depth: int) -> float:
+        return self.latency * (1 + depth / self.limit)
+
+
+class OrderedPolicy:
+    def route(self, depth: int, processors: list[ProcessorState]) -> list[str]:
+        return [p.name for p in processors if p.healthy]
+
+
+class CostAwarePolicy:
+    def __init__(self, max_wait: float = Config.ROUTING_MAX_WAIT):
+        self.max_wait = max_wait
+
+    def route(self, depth: int, processors: list[ProcessorState]) -> list[str]:
+        healthy = [p for p in processors if p.healthy]
+        if not healthy:
+            return []
+        best = min(healthy, key=lambda p: (p.eta(depth) > self.max_wait, p.fee))
+        return [best.name]
+
+
+class CheapestPolicy:
+    def route(self, depth: int, processors: list[ProcessorState]) -> list[str]:
+        cheapest = min(processors, key=lambda p: p.fee)
+        return [cheapest.name] if cheapest.healthy else []
+
+
+POLICIES = {
+    "ordered": OrderedPolicy,
+    "cost": CostAwarePolicy,
+    "cheapest": CheapestPolicy,
+}
+
+FEES = {
+    "default": Config.DEFAULT_FEE,
+    "fallback": Config.FALLBACK_FEE,
+}
+
+
+class RoutingEngine:
+    def __init__(
+        self,
+        processors: tuple[tuple[str, Client], ...],
+        health: HealthMonitor,
+        breakers: dict[str, CircuitBreaker],
+        limiters: dict[str, ConcurrencyLimiter],
+        policy: str = Config.ROUTING_POLICY,
+    ):
+        self.clients = dict(processors)
+        self.health = health
+        self.breakers = breakers
+        self.limiters = limiters
+        self.policy = POLICIES[policy]()
+        self.depth = 0
+        self.depth_gauge = registry.gauge(
+            "payment_queue_depth", "Payments waiting in the shared queue."
+        )
+
+    def state(self) -> list[ProcessorState]:
+        return [
+            ProcessorState(
+                name,
+                self.health.is_healthy(name) and not self.breakers[name].is_open(),
+                FEES[name],
+                max(
+                    self.limiters[name].baseline,
+                    self.health.min_response_time(name) / 1000,
+                ),
+                self.limiters[name].limit,
+            )
+            for name in self.clients
+        ]
+
+    def route(self) -> list[tuple[str, Client]]:
+        return [
+            (name, self.clients[name])
+            for name in self.policy.route(self.depth, self.state())
+        ]
+
+    def run(self):
+        while True:
+            try:
+                self.depth = keydb.llen(QUEUE_KEY)
+                self.depth_gauge.set(self.depth)
+            except Exception:
+                print("[Routing] Unexpected error:")
+                traceback.print_exc()
+            gevent.sleep(Config.QUEUE_POLL_INTERVAL)
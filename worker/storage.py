@@ -0,0 +1,126 @@
+import time
+import traceback
+
+import gevent
+from gevent.queue import Empty, Queue
+
+from common.codec import encode_member
+from common.store import (
+    BUCKETS_KEY,
+    GENERATION_KEY,
+    SHARDS_KEY,
+    bucket_of,
+    shard_of,
+    to_cents,
+)
+from restcraft.metrics import registry
+
+from .config import Config
+from .dispatcher import Dispatcher
+from .keydb import keydb
+
+STOP = object()
+
+store_duration = registry.histogram(
+    "payment_store_duration_seconds", "Time spent writing stored payment batches."
+)
+
+store_batch = keydb.register_script(
+    """
+    local added = 0
+    for i = 1, #ARGV, 6 do
+        local shard = ARGV[i + 5]
+        if redis.call('ZADD', 'payments:' .. shard, ARGV[i], ARGV[i + 1]) == 1 then
+            redis.call('ZADD', KEYS[1], shard, shard)
+            local bucket = ARGV[i + 4]
+            local key = 'summary:' .. bucket
+            redis.call('HINCRBY', key, ARGV[i + 2] .. ':count', 1)
+            redis.call('HINCRBY', key, ARGV[i + 2] .. ':cents', ARGV[i + 3])
+            redis.call('ZADD', KEYS[2], bucket, bucket)
+            added = added + 1
+        end
+    end
+    if added > 0 then
+        redis.call('INCR', KEYS[3])
+    end
+    return added
+    """
+)
+
+
+class PaymentWriter:
+    def __init__(self, dispatcher: Dispatcher):
+        self.dispatcher = dispatcher
+        self.queue = Queue()
+        self.stopping = False
+
+    def store(
+        self, payment: dict, payment_data: bytes, processor: str, timestamp: float
+    ):
+        cents = to_cents(payment["amount"])
+        member = encode_member(processor, cents, payment["correlation_id"])
+        self.queue.put(
+            (
+                (
+                    timestamp,
+                    member,
+                    processor,
+                    cents,
+                    bucket_of(timestamp),
+                    shard_of(timestamp),
+                ),
+                payment_data,
+            )
+        )
+
+    def collect(self) -> list[tuple[tuple, bytes]]:
+        item = self.queue.get()
+        if item is STOP:
+            self.stopping = True
+            return []
+        batch = [item]
+        deadline = time.monotonic() + Config.STORE_FLUSH_INTERVAL
+        while len(batch) < Config.STORE_BATCH_SIZE:
+            try:
+                item = self.queue.get(timeout=max(deadline - time.monotonic(), 0))
+            except Empty:
+                break
+            if item is STOP:
+                self.stopping = True
+                break
+            batch.append(item)
+        return batch
+
+    def write(self, batch: list[tuple[tuple, bytes]]):
+        started = time.perf_counter()
+        pipe = keydb.pipeline(transaction=False)
+        store_batch(
+            keys=[SHARDS_KEY, BUCKETS_KEY, GENERATION_KEY],
+            args=[arg for entry, _ in batch for arg in entry],
+            client=pipe,
+        )
+        for _, payment_data in batch:
+            self.dispatcher.ack(pipe, payment_data)
+        pipe.execute()
+        store_duration.observe(time.perf_counter() - started)
+
+    def flush(self, batch: list[tuple[tuple, bytes]]):
+        while True:
+            try:
+                self.write(batch)
+                return
+            except Exception:
+                print("[Storage] Unexpected error:")
+                traceback.print_exc()
+                gevent.sleep(Config.STORE_FLUSH_INTERVAL)
+
+    def run(self):
+        while not self.stopping:
+            if batch := self.collect():
+                self.flush(batch)
+        while not self.queue.empty():
+            batch = [self.queue.get() for _ in range(min(self.queue.qsize(), 1000))]
+            self.flush(batch)
+
+    def stop(self):
+        self.queue.put(STOP)